@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from app.models.event import Event
-from app.business_logic.extractors.base import extractor_registry, BaseExtractor
+from app.business_logic.extractors.base import extractor_registry, BaseExtractor, ExtractorRegistry
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -29,6 +29,23 @@ class EventProcessor:
         self.extractors = extractors or extractor_registry.get_all_extractors()
         logger.info(f"Initialized EventProcessor with {len(self.extractors)} extractors")
     
+    @classmethod
+    async def get_extractors_for_event_type(
+        cls,
+        event_type: str,
+        registry: ExtractorRegistry = extractor_registry
+    ) -> List[BaseExtractor]:
+        """Get the extractors that apply to events of the given type.
+        
+        Args:
+            event_type: The event type to look up
+            registry: Extractor registry to query, defaults to the global registry
+            
+        Returns:
+            List of extractors that can process events of this type
+        """
+        return registry.get_extractors_for_event(Event(event_type=event_type))
+    
     async def process_event(self, event: Event, db_session: AsyncSession) -> Event:
         """Process a single event through extractors exactly once.
         
@@ -39,30 +56,13 @@ class EventProcessor:
         Returns:
             The processed event or None if processing failed
         """
-        if not event:
-            logger.warning("Received empty event to process")
-            return None
-        
-        # Check if already processed to ensure idempotency
-        if event.is_processed:
-            logger.info(f"Event {event.id} already marked as processed, skipping")
-            return event
-        
-        logger.info(f"Processing event {event.id} of type {event.event_type}")
-        
-        # Find applicable extractors for this event by checking can_process for each
-        applicable_extractors = [ext for ext in self.extractors if ext.can_process(event)]
-        logger.info(f"Found {len(applicable_extractors)} applicable extractors for event {event.id}")
+        if not self._needs_processing(event):
+            # Already processed events are returned as-is; empty ones give None
+            return event or None
         
         # Process ALL extractors in a SINGLE transaction
         try:
-            # Apply each extractor
-            for extractor in applicable_extractors:
-                logger.debug(f"Applying extractor {extractor.get_name()} to event {event.id}")
-                await extractor.process(event, db_session)
-            
-            # Mark event as processed ONLY after all extractors run
-            event.is_processed = True
+            await self._run_extractors(event, db_session)
             await db_session.commit()
             logger.info(f"Successfully processed event {event.id}")
             return event
@@ -74,25 +74,83 @@ class EventProcessor:
             return None
     
     async def process_events(self, events: List[Event], db_session: AsyncSession) -> List[Event]:
-        """Process multiple events sequentially.
+        """Process multiple events sequentially and commit them once.
         
-        Each event is processed in its own transaction to isolate failures.
+        Each event is processed inside its own savepoint to isolate failures,
+        and the whole batch is committed in a single transaction.
         
         Args:
             events: The events to process
             db_session: Database session for persistence
             
         Returns:
-            The list of successfully processed events
+            The list of successfully processed events, empty if the batch
+            commit failed
         """
         processed_events = []
         
         for event in events:
+            if not self._needs_processing(event):
+                # Already processed events still count towards the result
+                if event:
+                    processed_events.append(event)
+                continue
+            
             try:
-                processed_event = await self.process_event(event, db_session)
-                if processed_event:
-                    processed_events.append(processed_event)
+                # Roll back only this event's changes if any extractor fails
+                async with db_session.begin_nested():
+                    await self._run_extractors(event, db_session)
+                processed_events.append(event)
             except Exception as e:
-                logger.error(f"Error processing event batch: {str(e)}")
+                logger.error(f"Error processing event {event.id}: {str(e)}")
+        
+        try:
+            await db_session.commit()
+        except Exception as e:
+            # A failed commit discards the whole batch, so nothing was processed
+            logger.error(f"Error committing event batch: {str(e)}")
+            await db_session.rollback()
+            return []
+        
+        logger.info(f"Successfully processed {len(processed_events)} of {len(events)} events")
+        return processed_events
+    
+    def _needs_processing(self, event: Optional[Event]) -> bool:
+        """Check whether an event still has to go through the extractors.
+        
+        Args:
+            event: The event to check
+            
+        Returns:
+            False for an empty event or one already marked as processed
+        """
+        if not event:
+            logger.warning("Received empty event to process")
+            return False
+        
+        # Check if already processed to ensure idempotency
+        if event.is_processed:
+            logger.info(f"Event {event.id} already marked as processed, skipping")
+            return False
+        
+        logger.info(f"Processing event {event.id} of type {event.event_type}")
+        return True
+    
+    async def _run_extractors(self, event: Event, db_session: AsyncSession) -> None:
+        """Apply all applicable extractors to an event and mark it as processed.
+        
+        Args:
+            event: The event to process
+            db_session: Database session for persistence
+        """
+        # Find applicable extractors for this event by checking can_process for each
+        applicable_extractors = [ext for ext in self.extractors if ext.can_process(event)]
+        logger.info(f"Found {len(applicable_extractors)} applicable extractors for event {event.id}")
+        
+        # Apply each extractor
+        for extractor in applicable_extractors:
+            logger.debug(f"Applying extractor {extractor.get_name()} to event {event.id}")
+            await extractor.process(event, db_session)
         
-        return processed_events 
\ No newline at end of file
+        # Mark event as processed ONLY after all extractors run
+        event.is_processed = True
\ No newline at end of file
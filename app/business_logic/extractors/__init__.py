@@ -11,6 +11,7 @@ from app.business_logic.extractors.base import (
     extractor_registry
 )
 from app.business_logic.extractors.utils import (
+    compile_path,
     find_paths_with_key,
     find_values_by_key,
     flatten_json,
@@ -18,6 +19,7 @@ from app.business_logic.extractors.utils import (
     extract_datetime,
     extract_numeric_values,
     merge_dictionaries,
+    compile_schema,
     extract_schema_fields,
     get_nested_value
 )
@@ -38,6 +40,7 @@ __all__ = [
     'BaseExtractor',
     'ExtractorRegistry',
     'extractor_registry',
+    'compile_path',
     'find_paths_with_key',
     'find_values_by_key',
     'flatten_json',
@@ -45,6 +48,7 @@ __all__ = [
     'extract_datetime',
     'extract_numeric_values',
     'merge_dictionaries',
+    'compile_schema',
     'extract_schema_fields',
     'get_nested_value',
     'UserActivityExtractor',
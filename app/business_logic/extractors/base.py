@@ -6,6 +6,7 @@ complex nested JSON data from events into dedicated relational fields.
 """
 
 from typing import Dict, Any, List, Type, Set, Optional, Callable, Union, Tuple
+from collections.abc import Mapping
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 from abc import ABC, abstractmethod
@@ -13,10 +14,30 @@ import traceback
 import json
 from datetime import datetime
 
+from app.business_logic.extractors.utils import _MISSING, compile_path
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
 
+def _str_to_bool(value: str) -> bool:
+    """Interpret common truthy strings as True and anything else as False."""
+    return value.lower() in ('true', 'yes', '1', 'y')
+
+
+def _str_to_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 string, including a trailing 'Z' for UTC."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# Converters for string values whose target type can't parse them directly;
+# any other conversion calls the target type itself
+_STRING_CONVERTERS = {
+    bool: _str_to_bool,
+    datetime: _str_to_datetime,
+}
+
+
 class BaseExtractor(ABC):
     """Base class for data extractors.
     
@@ -68,14 +89,12 @@ class BaseExtractor(ABC):
         if not data:
             return default
             
-        if isinstance(path, str):
-            path = path.split('.')
-            
         current = data
-        for key in path:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
+        for key in compile_path(path):
+            if not isinstance(current, Mapping):
+                return default
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
                 return default
                 
         return current
@@ -116,11 +135,10 @@ class BaseExtractor(ABC):
             return default
             
         try:
-            if target_type == bool and isinstance(value, str):
-                return value.lower() in ('true', 'yes', '1', 'y')
-                
-            if target_type == datetime and isinstance(value, str):
-                return datetime.fromisoformat(value.replace('Z', '+00:00'))
+            if isinstance(value, str):
+                converter = _STRING_CONVERTERS.get(target_type)
+                if converter is not None:
+                    return converter(value)
                 
             return target_type(value)
         except (ValueError, TypeError) as e:
@@ -215,6 +233,9 @@ class ExtractorRegistry:
         self._extractors = []
         self._extractors_by_name = {}
         self._extractors_by_event_type = {}
+        # Extractors that are not registered for a given event type and so must
+        # be asked via can_process; rebuilt lazily after any registration
+        self._generic_extractors_by_event_type = {}
     
     def register(self, extractor: BaseExtractor) -> None:
         """Register an extractor.
@@ -224,6 +245,7 @@ class ExtractorRegistry:
         """
         self._extractors.append(extractor)
         self._extractors_by_name[extractor.get_name()] = extractor
+        self._generic_extractors_by_event_type.clear()
         logger.info(f"Registered extractor: {extractor.get_name()}")
     
     def register_for_event_type(self, event_type: str, extractor: BaseExtractor) -> None:
@@ -237,6 +259,7 @@ class ExtractorRegistry:
             self._extractors_by_event_type[event_type] = []
             
         self._extractors_by_event_type[event_type].append(extractor)
+        self._generic_extractors_by_event_type.clear()
         logger.info(f"Registered extractor {extractor.get_name()} for event type {event_type}")
     
     def get_all_extractors(self) -> List[BaseExtractor]:
@@ -260,11 +283,31 @@ class ExtractorRegistry:
         event_type_extractors = self._extractors_by_event_type.get(event.event_type, [])
         
         # Also include extractors that explicitly say they can process this event
-        generic_extractors = [ext for ext in self._extractors 
-                             if ext not in event_type_extractors and ext.can_process(event)]
+        generic_extractors = [ext for ext in self._get_generic_extractors(event.event_type)
+                              if ext.can_process(event)]
         
         return event_type_extractors + generic_extractors
     
+    def _get_generic_extractors(self, event_type: str) -> List[BaseExtractor]:
+        """Get the registered extractors that are not specific to an event type.
+        
+        The result is cached per event type so the membership filtering is done
+        once rather than for every event.
+        
+        Args:
+            event_type: The event type to get generic extractors for
+            
+        Returns:
+            List of extractors not registered specifically for the event type
+        """
+        generic_extractors = self._generic_extractors_by_event_type.get(event_type)
+        if generic_extractors is None:
+            event_type_extractors = self._extractors_by_event_type.get(event_type, [])
+            generic_extractors = [ext for ext in self._extractors
+                                  if ext not in event_type_extractors]
+            self._generic_extractors_by_event_type[event_type] = generic_extractors
+        return generic_extractors
+    
     def get_extractor_by_name(self, name: str) -> Optional[BaseExtractor]:
         """Get an extractor by name.
         
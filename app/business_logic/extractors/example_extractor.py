@@ -11,6 +11,7 @@ from typing import Dict, Any, Optional, List
 
 from app.business_logic.extractors.base import BaseExtractor
 from app.business_logic.extractors.utils import (
+    compile_schema,
     extract_schema_fields,
     normalize_string,
     extract_datetime
@@ -21,6 +22,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Schema mapping for user fields, compiled once for every event
+USER_SCHEMA = compile_schema({
+    "user_id": ["user.id", "user_id", "userId", "account.user.id", "user_info.id", "auth.user_id"],
+    "username": ["user.name", "user.username", "username", "user_info.name", "name"],
+    "email": ["user.email", "email", "user_info.email", "account.email"],
+    "role": ["user.role", "role", "user_role", "user_info.role", "auth.role"]
+})
+
 
 class UserActivityExtractor(BaseExtractor):
     """Example extractor for user activity data.
@@ -29,6 +38,14 @@ class UserActivityExtractor(BaseExtractor):
     different JSON structures and extract consistent data.
     """
     
+    # User-related event types
+    EVENT_TYPES = frozenset({
+        "user_login",
+        "user_action",
+        "user_logout",
+        "user_error"
+    })
+    
     def can_process(self, event: Event) -> bool:
         """Determine if this extractor can process the given event.
         
@@ -44,10 +61,8 @@ class UserActivityExtractor(BaseExtractor):
         if not event.event_type or not event.data:
             return False
             
-        user_event_types = ["user_login", "user_action", "user_logout", "user_error"]
-        
         # Process specific event types
-        if event.event_type in user_event_types:
+        if event.event_type in self.EVENT_TYPES:
             return True
             
         # Also process any event with user data
@@ -127,16 +142,8 @@ class UserActivityExtractor(BaseExtractor):
         Returns:
             Dictionary with normalized user data
         """
-        # Define schema mapping for user fields
-        schema_mapping = {
-            "user_id": ["user.id", "user_id", "userId", "account.user.id", "user_info.id", "auth.user_id"],
-            "username": ["user.name", "user.username", "username", "user_info.name", "name"],
-            "email": ["user.email", "email", "user_info.email", "account.email"],
-            "role": ["user.role", "role", "user_role", "user_info.role", "auth.role"]
-        }
-        
         # Extract fields based on schema
-        user_data = extract_schema_fields(data, schema_mapping)
+        user_data = extract_schema_fields(data, USER_SCHEMA)
         
         # Normalize extracted values
         if "username" in user_data and isinstance(user_data["username"], str):
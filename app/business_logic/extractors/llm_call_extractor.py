@@ -25,6 +25,13 @@ class LLMCallExtractor(BaseExtractor):
     including performance metrics, token usage, and model details.
     """
     
+    # LLM call event types
+    EVENT_TYPES = frozenset({
+        "LLM_call_start",
+        "LLM_call_finish",
+        "LLM_call_blocked"
+    })
+    
     def can_process(self, event) -> bool:
         """Determine if this extractor can process the given event.
         
@@ -34,7 +41,7 @@ class LLMCallExtractor(BaseExtractor):
         Returns:
             True if this is an LLM call event, False otherwise
         """
-        return event.event_type in ["LLM_call_start", "LLM_call_finish", "LLM_call_blocked"]
+        return event.event_type in self.EVENT_TYPES
     
     async def process(self, event, db_session) -> None:
         """Process the event and extract data.
@@ -22,6 +22,14 @@ class ModelInfoExtractor(BaseExtractor):
     from various event types that include this information.
     """
     
+    # Event types that typically contain model info
+    EVENT_TYPES = frozenset({
+        "model_request",
+        "model_response",
+        "framework_patch",
+        "LLM_call_finish"
+    })
+    
     def can_process(self, event) -> bool:
         """Check if this event contains model info data.
         
@@ -34,15 +42,7 @@ class ModelInfoExtractor(BaseExtractor):
         if not event.data:
             return False
         
-        # Event types that typically contain model info
-        model_event_types = {
-            "model_request",
-            "model_response",
-            "framework_patch",
-            "LLM_call_finish"
-        }
-        
-        return event.event_type in model_event_types
+        return event.event_type in self.EVENT_TYPES
     
     async def process(self, event, db_session) -> None:
         """Extract model information from the event.
@@ -48,21 +48,21 @@ class ModelResponseExtractor(BaseExtractor):
             logger.warning(f"No data in model_response event {event.id}")
             return
         
-        # Extract token usage
-        await self._extract_token_usage(event, db_session)
+        # Extract token usage, performance metrics and content for analysis
+        models = [
+            await self._extract_token_usage(event),
+            await self._extract_performance_metrics(event),
+            await self._extract_content(event)
+        ]
         
-        # Extract performance metrics
-        await self._extract_performance_metrics(event, db_session)
-        
-        # Extract content for analysis
-        await self._extract_content(event, db_session)
+        # Add all extracted rows to the session in one call
+        db_session.add_all([model for model in models if model is not None])
     
-    async def _extract_token_usage(self, event, db_session) -> Optional[TokenUsage]:
+    async def _extract_token_usage(self, event) -> Optional[TokenUsage]:
         """Extract token usage data from the event.
         
         Args:
             event: The event to extract from
-            db_session: Database session for persistence
             
         Returns:
             The created TokenUsage object, or None if no token usage data
@@ -142,8 +142,6 @@ class ModelResponseExtractor(BaseExtractor):
                     model=model_name
                 )
                 
-                # Add to session
-                db_session.add(token_usage)
                 logger.info(f"Extracted token usage for event {event.id}: {input_tokens} input, {output_tokens} output")
                 
                 return token_usage
@@ -154,12 +152,11 @@ class ModelResponseExtractor(BaseExtractor):
             logger.error(f"Error extracting token usage for event {event.id}: {str(e)}")
             return None
     
-    async def _extract_performance_metrics(self, event, db_session) -> Optional[PerformanceMetric]:
+    async def _extract_performance_metrics(self, event) -> Optional[PerformanceMetric]:
         """Extract performance metrics from the event.
         
         Args:
             event: The event to extract from
-            db_session: Database session for persistence
             
         Returns:
             The created PerformanceMetric object, or None if no performance data
@@ -197,8 +194,6 @@ class ModelResponseExtractor(BaseExtractor):
                 timestamp=timestamp
             )
             
-            # Add to session
-            db_session.add(perf_metric)
             logger.info(f"Extracted performance metrics for event {event.id}: duration={duration_ms}ms")
             
             return perf_metric
@@ -206,12 +201,11 @@ class ModelResponseExtractor(BaseExtractor):
             logger.error(f"Error extracting performance metrics for event {event.id}: {str(e)}")
             return None
     
-    async def _extract_content(self, event, db_session) -> Optional[ContentAnalysis]:
+    async def _extract_content(self, event) -> Optional[ContentAnalysis]:
         """Extract and analyze content from the event.
         
         Args:
             event: The event to extract from
-            db_session: Database session for persistence
             
         Returns:
             The created ContentAnalysis object, or None if no content
@@ -290,8 +284,6 @@ class ModelResponseExtractor(BaseExtractor):
                 toxicity_score=None    # Could add toxicity analysis in future
             )
             
-            # Add to session
-            db_session.add(content_analysis)
             logger.info(f"Extracted content for event {event.id}: {word_count} words")
             
             return content_analysis
@@ -23,6 +23,12 @@ class MonitorEventExtractor(BaseExtractor):
     to track session lifecycle and configuration details.
     """
     
+    # Monitor lifecycle event types
+    EVENT_TYPES = frozenset({
+        "monitor_init",
+        "monitor_shutdown"
+    })
+    
     def can_process(self, event) -> bool:
         """Determine if this extractor can process the given event.
         
@@ -32,7 +38,7 @@ class MonitorEventExtractor(BaseExtractor):
         Returns:
             True if this is a monitor event, False otherwise
         """
-        return event.event_type in ["monitor_init", "monitor_shutdown"]
+        return event.event_type in self.EVENT_TYPES
     
     async def process(self, event, db_session) -> None:
         """Process the event and extract data.
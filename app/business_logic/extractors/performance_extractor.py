@@ -21,6 +21,13 @@ class PerformanceExtractor(BaseExtractor):
     various event types that include timing information.
     """
     
+    # Event types that typically contain performance data
+    EVENT_TYPES = frozenset({
+        "model_response",
+        "LLM_call_finish",
+        "call_finish"
+    })
+    
     def can_process(self, event) -> bool:
         """Check if this event contains performance data.
         
@@ -33,18 +40,11 @@ class PerformanceExtractor(BaseExtractor):
         if not event.data:
             return False
         
-        # Event types that typically contain performance data
-        perf_event_types = {
-            "model_response", 
-            "LLM_call_finish",
-            "call_finish"
-        }
-        
         # Also check for direct duration field in the event
         if event.duration_ms is not None and event.duration_ms > 0:
             return True
             
-        return event.event_type in perf_event_types
+        return event.event_type in self.EVENT_TYPES
     
     async def process(self, event, db_session) -> None:
         """Extract performance data from the event.
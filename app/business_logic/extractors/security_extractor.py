@@ -22,6 +22,13 @@ class SecurityExtractor(BaseExtractor):
     from events that contain security-related information.
     """
     
+    # Security-oriented event types
+    EVENT_TYPES = frozenset({
+        "LLM_call_start",
+        "LLM_call_finish",
+        "LLM_call_blocked"
+    })
+    
     def can_process(self, event) -> bool:
         """Check if this event contains security data.
         
@@ -48,13 +55,7 @@ class SecurityExtractor(BaseExtractor):
             return True
             
         # Check for security-oriented event types
-        security_event_types = {
-            "LLM_call_start",
-            "LLM_call_finish",
-            "LLM_call_blocked"
-        }
-        
-        return event.event_type in security_event_types
+        return event.event_type in self.EVENT_TYPES
     
     async def process(self, event, db_session) -> None:
         """Extract security information from the event.
@@ -23,6 +23,17 @@ class TokenUsageExtractor(BaseExtractor):
     different JSON structures that contain token information.
     """
     
+    # Event types that typically contain token usage data
+    EVENT_TYPES = frozenset({
+        "model_response",
+        "LLM_call_finish",
+        "model_request",
+        "LLM_call_start",
+        "conversation_response",
+        "embedding_request",
+        "embedding_response"
+    })
+    
     def can_process(self, event) -> bool:
         """Check if this event contains token usage data.
         
@@ -35,19 +46,8 @@ class TokenUsageExtractor(BaseExtractor):
         if not event.data:
             return False
             
-        # Event types that typically contain token usage data
-        token_event_types = {
-            "model_response", 
-            "LLM_call_finish",
-            "model_request",
-            "LLM_call_start",
-            "conversation_response",
-            "embedding_request",
-            "embedding_response"
-        }
-        
         # Check if event type is in our known list
-        if event.event_type in token_event_types:
+        if event.event_type in self.EVENT_TYPES:
             return True
             
         # For other event types, check if data has token usage fields
@@ -6,13 +6,67 @@ and manipulation used by the extractors.
 """
 
 from typing import Dict, Any, List, Union, Optional, Type, Tuple, Set, Callable
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
 import logging
 import re
 import json
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for dictionary lookups where None is a legitimate value
+_MISSING = object()
+
+# Signed integers and decimals, e.g. "-10" or "30.5"
+_NUM_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
+# Runs of whitespace, collapsed to a single space by normalize_string
+_WS_RE = re.compile(r'\s+')
+
+# strptime formats tried by extract_datetime when ISO 8601 parsing fails
+_DATETIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d',
+    '%Y/%m/%d %H:%M:%S',
+)
+
+
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dot-notation path into a tuple of keys, memoized per path string."""
+    return tuple(path.split('.'))
+
+
+def compile_path(path: Union[str, List[str], Tuple[str, ...]]) -> Tuple[str, ...]:
+    """Convert a path into a tuple of keys.
+    
+    Dot-notation strings are split once and cached, since extractors look up
+    the same paths for every event.
+    
+    Args:
+        path: A dot-notation string or sequence of keys
+        
+    Returns:
+        Tuple of keys making up the path
+    """
+    if isinstance(path, str):
+        return _split_path(path)
+    return tuple(path)
+
+
+def _push_children(stack: List[Tuple], node: Any, path: Tuple[str, ...]) -> None:
+    """Push the children of a dict or list node onto a depth-first walk stack.
+    
+    Children are pushed in reverse so they are popped in their original order.
+    Each stack entry is (parent_path, key, value, is_dict_key).
+    """
+    if isinstance(node, dict):
+        stack.extend((path, key, value, True) for key, value in reversed(node.items()))
+    elif isinstance(node, list):
+        stack.extend((path, str(i), node[i], False) for i in range(len(node) - 1, -1, -1))
+
 
 def find_paths_with_key(data: Dict[str, Any], target_key: str) -> List[List[str]]:
     """Find all paths to a specific key in a nested JSON structure.
@@ -25,20 +79,16 @@ def find_paths_with_key(data: Dict[str, Any], target_key: str) -> List[List[str]
         List of paths (as lists of keys) to the target key
     """
     results = []
+    stack = []
+    _push_children(stack, data, ())
+    
+    while stack:
+        path, key, value, is_dict_key = stack.pop()
+        if is_dict_key and key == target_key:
+            results.append([*path, key])
+        if isinstance(value, (dict, list)):
+            _push_children(stack, value, path + (key,))
     
-    def search(current_data, current_path):
-        if isinstance(current_data, dict):
-            for key, value in current_data.items():
-                if key == target_key:
-                    results.append(current_path + [key])
-                if isinstance(value, (dict, list)):
-                    search(value, current_path + [key])
-        elif isinstance(current_data, list):
-            for i, item in enumerate(current_data):
-                if isinstance(item, (dict, list)):
-                    search(item, current_path + [str(i)])
-    
-    search(data, [])
     return results
 
 
@@ -53,20 +103,16 @@ def find_values_by_key(data: Dict[str, Any], target_key: str) -> List[Any]:
         List of values for the target key
     """
     results = []
+    stack = []
+    _push_children(stack, data, ())
+    
+    while stack:
+        _, key, value, is_dict_key = stack.pop()
+        if is_dict_key and key == target_key:
+            results.append(value)
+        if isinstance(value, (dict, list)):
+            _push_children(stack, value, ())
     
-    def search(current_data):
-        if isinstance(current_data, dict):
-            for key, value in current_data.items():
-                if key == target_key:
-                    results.append(value)
-                if isinstance(value, (dict, list)):
-                    search(value)
-        elif isinstance(current_data, list):
-            for item in current_data:
-                if isinstance(item, (dict, list)):
-                    search(item)
-    
-    search(data)
     return results
 
 
@@ -81,24 +127,18 @@ def flatten_json(data: Dict[str, Any], delimiter: str = '.') -> Dict[str, Any]:
         A flattened dictionary
     """
     flattened = {}
+    # Each entry is (key_parts, node); keys are joined once, at the leaves
+    stack = [((), data)]
+    
+    while stack:
+        parts, node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend((parts + (str(key),), value) for key, value in reversed(node.items()))
+        elif isinstance(node, list):
+            stack.extend((parts + (str(i),), node[i]) for i in range(len(node) - 1, -1, -1))
+        elif parts:
+            flattened[delimiter.join(parts)] = node
     
-    def flatten(current_data, prefix=''):
-        if isinstance(current_data, dict):
-            for key, value in current_data.items():
-                new_prefix = f"{prefix}{delimiter}{key}" if prefix else key
-                if isinstance(value, (dict, list)):
-                    flatten(value, new_prefix)
-                else:
-                    flattened[new_prefix] = value
-        elif isinstance(current_data, list):
-            for i, item in enumerate(current_data):
-                new_prefix = f"{prefix}{delimiter}{i}"
-                if isinstance(item, (dict, list)):
-                    flatten(item, new_prefix)
-                else:
-                    flattened[new_prefix] = item
-    
-    flatten(data)
     return flattened
 
 
@@ -116,13 +156,8 @@ def normalize_string(value: str) -> str:
     if not value or not isinstance(value, str):
         return ""
     
-    # Convert to lowercase and strip whitespace
-    normalized = value.lower().strip()
-    
-    # Replace multiple spaces with a single space
-    normalized = re.sub(r'\s+', ' ', normalized)
-    
-    return normalized
+    # Collapse whitespace runs to a single space, then strip and lowercase
+    return _WS_RE.sub(' ', value).strip().lower()
 
 
 def extract_datetime(value: Any) -> Optional[datetime]:
@@ -148,20 +183,16 @@ def extract_datetime(value: Any) -> Optional[datetime]:
             pass
     
     if isinstance(value, str):
-        # Try multiple formats
-        formats = [
-            # ISO format
-            lambda v: datetime.fromisoformat(v.replace('Z', '+00:00')),
-            # Common formats
-            lambda v: datetime.strptime(v, '%Y-%m-%d %H:%M:%S'),
-            lambda v: datetime.strptime(v, '%Y-%m-%dT%H:%M:%S'),
-            lambda v: datetime.strptime(v, '%Y-%m-%d'),
-            lambda v: datetime.strptime(v, '%Y/%m/%d %H:%M:%S'),
-        ]
+        # Fast path: ISO format, parsed natively by fromisoformat
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            pass
         
-        for format_parser in formats:
+        # Fall back to the slower strptime for other common formats
+        for fmt in _DATETIME_FORMATS:
             try:
-                return format_parser(value)
+                return datetime.strptime(value, fmt)
             except ValueError:
                 continue
     
@@ -181,64 +212,102 @@ def extract_numeric_values(text: str) -> List[float]:
     if not text or not isinstance(text, str):
         return []
     
-    # Find all numeric patterns (including decimals)
-    pattern = r'-?\d+(?:\.\d+)?'
-    matches = re.findall(pattern, text)
-    
-    # Convert matches to float
-    return [float(match) for match in matches]
+    # Find all numeric patterns (including decimals) and convert them to float;
+    # map keeps the conversion loop in C
+    return list(map(float, _NUM_RE.findall(text)))
 
 
 def merge_dictionaries(dict1: Dict[str, Any], dict2: Dict[str, Any], 
-                      overwrite: bool = True) -> Dict[str, Any]:
+                      overwrite: bool = True, inplace: bool = False) -> Dict[str, Any]:
     """Merge two dictionaries recursively.
     
+    Nested dictionaries are merged with an explicit stack rather than recursion.
+    Unless inplace is set, only the nested dictionaries of dict1 that are written
+    to are copied, so dict1 itself is left untouched.
+    
     Args:
         dict1: The first dictionary
         dict2: The second dictionary to merge into the first
         overwrite: Whether to overwrite values in dict1 with values from dict2
+        inplace: Whether to merge into dict1 directly instead of a copy
         
     Returns:
         The merged dictionary
     """
-    result = dict1.copy()
+    result = dict1 if inplace else dict1.copy()
+    stack = [(result, dict2)]
     
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            # Recursively merge nested dictionaries
-            result[key] = merge_dictionaries(result[key], value, overwrite)
-        elif key not in result or overwrite:
-            # Add or overwrite the value
-            result[key] = value
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            existing = target.get(key, _MISSING)
+            if existing is _MISSING:
+                # Add the value
+                target[key] = value
+            elif isinstance(existing, dict) and isinstance(value, dict):
+                # Merge nested dictionaries, copying dict1's side on write
+                if not inplace:
+                    existing = target[key] = existing.copy()
+                stack.append((existing, value))
+            elif overwrite:
+                # Overwrite the value
+                target[key] = value
     
     return result
 
 
-def extract_schema_fields(data: Dict[str, Any], schema_fields: Dict[str, Union[str, List[str]]]) -> Dict[str, Any]:
+def compile_schema(schema_fields: "Mapping[str, Union[str, List[str]]]") -> Tuple[Tuple[str, Tuple[Tuple[str, ...], ...]], ...]:
+    """Compile a schema mapping into pre-split paths for extract_schema_fields.
+    
+    Extractors that apply the same schema to every event can compile it once
+    and pass the result to extract_schema_fields instead of the mapping.
+    
+    Args:
+        schema_fields: Mapping of output field names to input field paths. Each
+            path is a dot-notation string or a tuple of keys; a list of paths
+            gives alternatives tried in order
+        
+    Returns:
+        Tuple of (field name, tuple of key paths) pairs
+    """
+    compiled = []
+    
+    for field_name, path in schema_fields.items():
+        paths = path if isinstance(path, list) else [path]
+        compiled.append((field_name, tuple(compile_path(p) for p in paths if p)))
+    
+    return tuple(compiled)
+
+
+def extract_schema_fields(data: Dict[str, Any], 
+                          schema_fields: Union["Mapping[str, Union[str, List[str]]]", Tuple]) -> Dict[str, Any]:
     """Extract fields from data based on a schema mapping.
     
     Args:
         data: The data dictionary to extract from
-        schema_fields: Mapping of output field names to input field paths
+        schema_fields: Mapping of output field names to input field paths,
+            or a schema compiled with compile_schema
         
     Returns:
         Dictionary with extracted fields according to the schema
     """
     result = {}
     
-    for field_name, path in schema_fields.items():
-        if isinstance(path, list):
-            # Try multiple paths
-            for p in path:
-                value = get_nested_value(data, p)
-                if value is not None:
-                    result[field_name] = value
+    if isinstance(schema_fields, Mapping):
+        schema_fields = compile_schema(schema_fields)
+    
+    for field_name, paths in schema_fields:
+        # Try each path in turn, keeping the first non-None value
+        for keys in paths:
+            current = data
+            for key in keys:
+                if not isinstance(current, Mapping):
+                    current = None
                     break
-        else:
-            # Single path
-            value = get_nested_value(data, path)
-            if value is not None:
-                result[field_name] = value
+                current = current.get(key)
+            if current is not None:
+                result[field_name] = current
+                break
     
     return result
 
@@ -257,13 +326,13 @@ def get_nested_value(data: Dict[str, Any], path: str, default: Any = None) -> An
     if not data or not path:
         return default
         
-    parts = path.split('.')
     current = data
     
-    for part in parts:
-        if isinstance(current, dict) and part in current:
-            current = current[part]
-        else:
+    for part in compile_path(path):
+        if not isinstance(current, Mapping):
+            return default
+        current = current.get(part, _MISSING)
+        if current is _MISSING:
             return default
             
     return current 
\ No newline at end of file
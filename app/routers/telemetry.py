@@ -12,6 +12,7 @@ from app.database.init_db import get_session
 from app.models.agent import Agent
 from app.models.event import Event
 from app.models.session import Session
+from app.schemas import TelemetryResponse
 from app.transformers.event_transformer import EventTransformer
 from app.business_logic.event_processor import EventProcessor
 
@@ -289,7 +290,12 @@ def validate_telemetry_event(event_data: Dict[str, Any]) -> List[str]:
     
     return errors
 
-@router.post("/", status_code=status.HTTP_202_ACCEPTED)
+@router.post(
+    "/",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=TelemetryResponse,
+    response_model_exclude_unset=True
+)
 async def ingest_telemetry(
     background_tasks: BackgroundTasks,
     event_data: Dict[str, Any] = Body(...),
@@ -298,6 +304,8 @@ async def ingest_telemetry(
     """
     Ingest a telemetry event from the monitoring SDK.
     This endpoint quickly validates the event and queues it for processing.
+    The response model lets FastAPI serialize the acknowledgement straight to
+    JSON bytes through Pydantic.
     """
     # Validate the event data
     validation_errors = validate_telemetry_event(event_data)
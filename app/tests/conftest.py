@@ -1,16 +1,21 @@
 import os
-import sys
+import logging
 import pytest
 import asyncio
 import pytest_asyncio
 import shutil
-from pathlib import Path
+from types import SimpleNamespace
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
-# Fix Python path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from app.main import app
 from app.database.init_db import get_session
@@ -21,40 +26,92 @@ from app.tests.test_config import (
     should_preserve_db, 
     get_test_db_path,
     reset_test_environment,
-    get_project_root
+    get_project_root,
+    configure_test_logging,
+    set_fast_sqlite_pragmas,
+    use_explicit_begin
 )
 
-# Setup fixtures for unit tests using in-memory database
-@pytest.fixture(scope="function")
-async def setup_unit_test_env():
-    """Setup the environment for unit tests with in-memory database."""
-    # Configure environment for in-memory database
-    db_path = setup_memory_db()
-    
-    # Create test engine for in-memory database
+logger = logging.getLogger(__name__)
+
+def pytest_configure(config):
+    """Route test helper debug logging to the console if requested."""
+    configure_test_logging()
+
+if uvloop is not None:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+def create_memory_engine():
+    """Create an engine for an in-memory SQLite test database.
+    
+    A StaticPool keeps a single connection open, so the database survives for
+    as long as the engine does, and durability pragmas are turned off since
+    nothing needs to outlive the test run. Transactions are begun explicitly
+    so that savepoints nest inside them.
+    """
     test_engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
+        poolclass=StaticPool,
         connect_args={"check_same_thread": False},
         future=True
     )
     
+    @event.listens_for(test_engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        set_fast_sqlite_pragmas(dbapi_connection)
+    
+    use_explicit_begin(test_engine)
+    
+    return test_engine
+
+# Engine for unit tests using in-memory database
+@pytest_asyncio.fixture(scope="session")
+async def unit_test_engine():
+    """Create the in-memory database and its schema once per test session.
+    
+    Each pytest-xdist worker runs its own session, so every worker gets a
+    private in-memory database.
+    """
+    test_engine = create_memory_engine()
+    
     # Create all tables from Base metadata
     async with test_engine.begin() as conn:
-        await conn.run_sync(lambda conn: Base.metadata.create_all(conn))
+        await conn.run_sync(Base.metadata.create_all)
     
-    # Session factory for in-memory tests
-    TestingSessionLocal = sessionmaker(
-        test_engine, 
-        expire_on_commit=False, 
-        class_=AsyncSession
-    )
+    yield test_engine
     
-    # Store engine and session factory in function attributes to access in other fixtures
-    setup_unit_test_env.engine = test_engine
-    setup_unit_test_env.session_factory = TestingSessionLocal
+    await test_engine.dispose()
+
+# Setup fixtures for unit tests using in-memory database
+@pytest.fixture(scope="function")
+async def setup_unit_test_env(unit_test_engine):
+    """Setup the environment for unit tests with in-memory database.
     
-    yield
+    Every test runs inside an outer transaction that is rolled back afterwards,
+    so sessions can commit freely without leaking data into other tests.
+    """
+    # Configure environment for in-memory database
+    db_path = setup_memory_db()
+    
+    async with unit_test_engine.connect() as connection:
+        transaction = await connection.begin()
+        
+        # Session factory for in-memory tests; session commits only release
+        # a savepoint inside the outer transaction
+        TestingSessionLocal = sessionmaker(
+            connection, 
+            expire_on_commit=False, 
+            class_=AsyncSession,
+            join_transaction_mode="create_savepoint"
+        )
+        
+        yield SimpleNamespace(engine=unit_test_engine, session_factory=TestingSessionLocal)
+        
+        await transaction.rollback()
     
     # Reset environment after test
     reset_test_environment()
@@ -74,7 +131,7 @@ async def setup_integration_test_env():
     db_dir = os.path.dirname(db_path)
     os.makedirs(db_dir, exist_ok=True)
     
-    print(f"Integration test using database at: {db_path}")
+    logger.debug(f"Integration test using database at: {db_path}")
     
     # Create test engine for file-based database
     test_engine = create_async_engine(
@@ -84,6 +141,12 @@ async def setup_integration_test_env():
         future=True
     )
     
+    # The file is kept for inspection, but nothing relies on it surviving a
+    # crash, so skip the fsync on every commit
+    @event.listens_for(test_engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        set_fast_sqlite_pragmas(dbapi_connection)
+    
     # Create all tables from Base metadata
     async with test_engine.begin() as conn:
         await conn.run_sync(lambda conn: Base.metadata.create_all(conn))
@@ -95,31 +158,22 @@ async def setup_integration_test_env():
         class_=AsyncSession
     )
     
-    # Store engine and session factory in function attributes
-    setup_integration_test_env.engine = test_engine
-    setup_integration_test_env.session_factory = TestingSessionLocal
-    
-    yield
+    yield SimpleNamespace(engine=test_engine, session_factory=TestingSessionLocal)
     
-    # Only reset environment, don't delete the database file
+    # Close the engine's connections and reset the environment, but keep the
+    # database file for inspection
+    await test_engine.dispose()
     reset_test_environment()
 
 # Database setup for unit tests (in-memory)
 @pytest_asyncio.fixture(scope="function")
 async def setup_unit_test_db(setup_unit_test_env):
-    """Setup the in-memory test database for unit tests."""
-    engine = setup_unit_test_env.engine
-    
-    # Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+    """Setup the in-memory test database for unit tests.
     
+    The schema is created once by unit_test_engine and each test's changes are
+    rolled back by setup_unit_test_env, so there is nothing to rebuild here.
+    """
     yield
-    
-    # Clean up after each test
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
 
 # Database setup for integration tests (file-based)
 @pytest_asyncio.fixture(scope="function")
@@ -210,6 +264,33 @@ def integration_test_client(override_get_session_integration_test):
     with TestClient(app) as client:
         yield client
 
+# Shared test client for tests that manage their own dependency overrides
+@pytest.fixture(scope="session")
+def client():
+    """Return a TestClient shared by every test in the session.
+    
+    The app's lifespan is not run, so no startup work happens; tests set up
+    whatever dependency overrides they need themselves.
+    """
+    return TestClient(app)
+
+# Shared async client for async tests
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """Return an httpx AsyncClient that calls the app in-process.
+    
+    Requests are awaited on the test's own event loop instead of being handed
+    to TestClient's background thread. Like client, the app's lifespan is not
+    run, and background tasks finish before each response is returned. Post
+    to the canonical, slash-terminated route paths to avoid a redirect.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        follow_redirects=True
+    ) as client:
+        yield client
+
 # Legacy fixtures for backward compatibility
 @pytest_asyncio.fixture(scope="function")
 async def setup_test_db():
@@ -218,12 +299,7 @@ async def setup_test_db():
     db_path = setup_memory_db()
     
     # Create test engine
-    test_engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        echo=False,
-        connect_args={"check_same_thread": False},
-        future=True
-    )
+    test_engine = create_memory_engine()
     
     # Create tables
     async with test_engine.begin() as conn:
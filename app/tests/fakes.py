@@ -0,0 +1,73 @@
+"""
+Test doubles shared across the test suite.
+
+FakeEvent stands in for an Event and FakeSession for an AsyncSession, so unit
+tests can drive extractors and the event processor without a database.
+"""
+
+from contextlib import asynccontextmanager
+
+
+class FakeEvent:
+    """Slotted stand-in for an Event, with only the attributes code under test reads."""
+    
+    __slots__ = ("id", "event_type", "timestamp", "agent_id", "data", "alert", "is_processed")
+    
+    def __init__(self, id=None, event_type=None, timestamp=None, agent_id=None,
+                 data=None, alert=None, is_processed=False):
+        self.id = id
+        self.event_type = event_type
+        self.timestamp = timestamp
+        self.agent_id = agent_id
+        self.data = data
+        self.alert = alert
+        self.is_processed = is_processed
+
+
+class EmptyResult:
+    """Query result with no rows, as returned by FakeSession.execute."""
+    
+    def scalars(self):
+        return self
+    
+    def first(self):
+        return None
+
+
+class FakeSession:
+    """Database session fake that records what tests do with it.
+    
+    Added objects are kept in order, every query finds nothing, and commits,
+    rollbacks and savepoints are only counted.
+    """
+    
+    def __init__(self):
+        self.added = []
+        self.execute_calls = 0
+        self.commit_calls = 0
+        self.rollback_calls = 0
+        self.savepoint_calls = 0
+        self.savepoint_rollback_calls = 0
+    
+    def add(self, obj):
+        self.added.append(obj)
+    
+    async def execute(self, *args, **kwargs):
+        self.execute_calls += 1
+        return EmptyResult()
+    
+    @asynccontextmanager
+    async def begin_nested(self):
+        self.savepoint_calls += 1
+        try:
+            yield
+        except Exception:
+            # Like a real savepoint, roll back and let the error propagate
+            self.savepoint_rollback_calls += 1
+            raise
+    
+    async def commit(self):
+        self.commit_calls += 1
+    
+    async def rollback(self):
+        self.rollback_calls += 1
@@ -16,6 +16,8 @@ import uuid
 from datetime import datetime
 from pathlib import Path
 from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
 
 # Fix path for imports if running directly
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -26,9 +28,6 @@ from app.models.event import Event
 from app.models.agent import Agent
 from app.models.session import Session
 
-# Mark test module to use asyncio
-pytestmark = [pytest.mark.asyncio]
-
 # Setup integration test environment for all tests in the module
 @pytest.fixture(scope="module")
 def setup_integration_test_env():
@@ -37,10 +36,6 @@ def setup_integration_test_env():
     db_path = setup_file_db()
     print(f"\nTest database located at: {os.path.abspath(db_path)}")
     
-    # Create test engine with absolute path
-    from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-    from sqlalchemy.orm import sessionmaker
-    
     # Ensure the path is absolute
     if not os.path.isabs(db_path) and db_path != ":memory:":
         db_path = os.path.join(get_project_root(), db_path)
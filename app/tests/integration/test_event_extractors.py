@@ -150,7 +150,6 @@ class TestEventExtractorsIntegration:
         
         return session
     
-    @pytest.mark.asyncio
     async def test_registry_finds_correct_extractors(self):
         """Test that the registry returns the correct extractors for event types."""
         # Test LLM_call_start event
@@ -177,7 +176,6 @@ class TestEventExtractorsIntegration:
         extractors = extractor_registry.get_extractors_for_event(framework_patch_event)
         assert any(isinstance(extractor, FrameworkExtractor) for extractor in extractors)
     
-    @pytest.mark.asyncio
     async def test_llm_call_start_processing(self, mock_event_llm_call_start, mock_db_session):
         """Test processing of LLM_call_start events through the registry."""
         # Get extractors that can process this event
@@ -207,7 +205,6 @@ class TestEventExtractorsIntegration:
                 
         assert security_alert_added, "No SecurityAlert was added to the session"
     
-    @pytest.mark.asyncio
     async def test_llm_call_finish_processing(self, mock_event_llm_call_finish, mock_db_session):
         """Test processing of LLM_call_finish events through the registry."""
         # Get extractors that can process this event
@@ -254,7 +251,6 @@ class TestEventExtractorsIntegration:
         assert performance_metric_added, "No PerformanceMetric was added to the session"
         assert model_details_added, "No ModelDetails was added to the session"
     
-    @pytest.mark.asyncio
     @patch('app.business_logic.extractors.monitor_event_extractor.Session')
     async def test_monitor_init_processing(self, mock_session_class, mock_event_monitor_init, mock_db_session):
         """Test processing of monitor_init events directly with a MonitorEventExtractor."""
@@ -277,7 +273,6 @@ class TestEventExtractorsIntegration:
         mock_session_class.assert_called_once()
         mock_db_session.add.assert_called_with(mock_session_instance)
     
-    @pytest.mark.asyncio
     async def test_framework_patch_processing(self, mock_event_framework_patch, mock_db_session):
         """Test processing of framework_patch events directly with a FrameworkExtractor."""
         # Create a direct instance of the extractor
@@ -307,7 +302,6 @@ class TestEventExtractorsIntegration:
         # Verify that the framework details were added to the session
         assert mock_db_session.add.called
     
-    @pytest.mark.asyncio
     @patch('app.business_logic.extractors.monitor_event_extractor.Session')
     async def test_all_event_types_with_direct_extractors(self, mock_session_class, 
                                                        mock_event_llm_call_start, 
@@ -88,7 +88,6 @@ class TestExtractorProcessorIntegration:
         
         return session
     
-    @pytest.mark.asyncio
     async def test_processor_finds_applicable_extractors(self, create_event, processor_with_custom_extractors, mock_db_session):
         """Test that EventProcessor finds the right extractors for each event type."""
         # Create test events
@@ -136,7 +135,6 @@ class TestExtractorProcessorIntegration:
         assert unknown_event.is_processed is True
         mock_db_session.commit.assert_called()
     
-    @pytest.mark.asyncio
     async def test_process_events_batch(self, create_event, processor_with_custom_extractors, mock_db_session):
         """Test processing multiple events in a batch."""
         # Create test events
@@ -161,7 +159,6 @@ class TestExtractorProcessorIntegration:
         # Verify db session was used
         assert mock_db_session.commit.call_count >= len(events)
     
-    @pytest.mark.asyncio
     async def test_extractor_error_handling(self, create_event, mock_db_session):
         """Test that errors in one extractor don't affect other extractors."""
         # Create a failing extractor
@@ -201,7 +198,6 @@ class TestExtractorProcessorIntegration:
         # Verify db session was committed
         mock_db_session.commit.assert_called()
     
-    @pytest.mark.asyncio
     async def test_multiple_applicable_extractors(self, create_event, mock_db_session):
         """Test that multiple applicable extractors are all applied to the same event."""
         # Create multiple extractors that can all process the same event
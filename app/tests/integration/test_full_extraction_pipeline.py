@@ -58,7 +58,6 @@ class TestFullExtractionPipeline:
         """Create an event processor instance."""
         return EventProcessor()
     
-    @pytest.mark.asyncio
     async def test_pipeline_ingestion_to_query(self, example_records, event_processor):
         """
         Test the complete flow from data ingestion to querying.
@@ -159,7 +158,6 @@ class TestFullExtractionPipeline:
             finally:
                 pass # Session is automatically closed by the async context manager
     
-    @pytest.mark.asyncio
     async def test_metrics_calculation_with_real_data(self, example_records, event_processor):
         """Test metrics calculators with real data."""
         # Get a database session
@@ -106,7 +106,6 @@ class TestPerformance:
                 "agent_ids": agent_ids
             }
     
-    @pytest.mark.asyncio
     async def test_batch_processing_performance(self, example_records, event_processor):
         """Test the performance of batch processing events."""
         batch_sizes = [1, 5, 10, 20, 50]
@@ -163,7 +162,6 @@ class TestPerformance:
             if batch_size > 1:  # Only check for batch sizes > 1
                 assert perf["events_per_second"] > 0.5, f"Processing too slow for batch size {batch_size}"
     
-    @pytest.mark.asyncio
     async def test_api_response_times(self, populated_db):
         """Test the response times of various API endpoints."""
         endpoints = [
@@ -210,7 +208,6 @@ class TestPerformance:
         for endpoint, times in results.items():
             assert times["avg_response_time"] < 1.0, f"Average response time too slow for {endpoint}"
     
-    @pytest.mark.asyncio
     async def test_concurrent_requests_performance(self, populated_db):
         """Test performance under concurrent load."""
         base_endpoints = [
@@ -254,7 +251,6 @@ class TestPerformance:
             # Expect at least 2x speedup from concurrency (adjust if needed)
             assert sequential_time / total_time > 2.0, "Not getting enough speedup from concurrent requests"
     
-    @pytest.mark.asyncio
     async def test_database_query_performance(self, populated_db):
         """Test the performance of common database queries."""
         queries = [
@@ -0,0 +1,70 @@
+"""
+Telemetry endpoint tests that store events in the database.
+
+The endpoint's get_session dependency is overridden with the in-memory unit
+test database, so each test's events are rolled back when it finishes.
+"""
+import pytest
+from functools import lru_cache
+from fastapi import status
+from sqlalchemy import select
+
+from app.models.event import Event
+from app.transformers import json_utils
+from app.tests.telemetry_data import VALID_EVENT, VALID_EVENT_BODY, JSON_HEADERS
+
+# Load test data from example JSON files; each file is read at most once
+@lru_cache(maxsize=None)
+def load_test_data_from_file(filename):
+    try:
+        with open(f"input_json_records_examples/{filename}", "rb") as f:
+            # Get first line which is a single JSON object
+            line = f.readline().strip()
+            return json_utils.loads(line)
+    except FileNotFoundError:
+        return None
+
+async def test_event_stored_in_database(async_client, override_get_session_unit_test, unit_test_session):
+    """Test that valid events are stored in the database."""
+    # Send a valid event
+    response = await async_client.post(
+        "/api/v1/telemetry/",
+        content=VALID_EVENT_BODY,
+        headers=JSON_HEADERS
+    )
+    # The endpoint's background tasks run before the response is returned,
+    # so the event has already been processed here
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    
+    event = await unit_test_session.scalar(
+        select(Event).where(
+            Event.agent_id == VALID_EVENT["agent_id"],
+            Event.event_type == VALID_EVENT["event_type"]
+        )
+    )
+    
+    assert event is not None
+    assert event.agent_id == VALID_EVENT["agent_id"]
+    assert event.event_type == VALID_EVENT["event_type"]
+
+async def test_with_example_json_files(async_client, override_get_session_unit_test, unit_test_session):
+    """Test the telemetry endpoint with real-world examples from the provided JSON files."""
+    # Load example data
+    weather_event = load_test_data_from_file("weather_monitoring.json")
+    if not weather_event:
+        pytest.skip("Example JSON file not found, skipping test")
+    
+    # Send the event
+    response = await async_client.post("/api/v1/telemetry/", json=weather_event)
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    
+    event = await unit_test_session.scalar(
+        select(Event).where(
+            Event.agent_id == weather_event["agent_id"],
+            Event.event_type == weather_event["event_type"]
+        )
+    )
+    
+    assert event is not None
+    assert event.agent_id == weather_event["agent_id"]
+    assert event.event_type == weather_event["event_type"]
@@ -22,9 +22,6 @@ from app.models.agent import Agent
 from app.models.session import Session
 from app.tests.test_config import setup_file_db, get_test_db_path, get_project_root, should_preserve_db
 
-# Mark all tests as asyncio
-pytestmark = pytest.mark.asyncio
-
 # Load example telemetry records
 EXAMPLE_RECORDS_PATH = os.path.join(get_project_root(), "resources/example_input_json_records/example_records.json")
 
@@ -42,10 +39,6 @@ def setup_integration_test_env():
     db_path = setup_file_db(preserve_db=True)
     print(f"Using preserved test database at: {db_path}")
     
-    # Create test engine with absolute path
-    from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-    from sqlalchemy.orm import sessionmaker
-    
     # Ensure the path is absolute
     if not os.path.isabs(db_path) and db_path != ":memory:":
         db_path = os.path.join(get_project_root(), db_path)
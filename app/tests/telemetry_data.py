@@ -0,0 +1,28 @@
+"""
+Telemetry request payloads shared by the telemetry endpoint tests.
+"""
+import json
+
+# Test data for valid events
+VALID_EVENT = {
+    "timestamp": "2025-03-18T18:57:11.620036Z",
+    "level": "INFO",
+    "agent_id": "test-agent",
+    "event_type": "TEST_EVENT",
+    "channel": "TEST",
+    "data": {"message": "This is a test event"}
+}
+
+# Test data for events with invalid fields: the valid event with one required
+# field removed, keyed by the missing field
+INVALID_EVENTS = {
+    missing: {key: value for key, value in VALID_EVENT.items() if key != missing}
+    for missing in ("timestamp", "agent_id", "event_type")
+}
+
+# The request payloads never change, so serialize their bodies once
+VALID_EVENT_BODY = json.dumps(VALID_EVENT).encode()
+INVALID_EVENT_BODY = json.dumps(INVALID_EVENTS["timestamp"]).encode()
+MIXED_BATCH_BODY = json.dumps([VALID_EVENT, *INVALID_EVENTS.values()]).encode()
+
+JSON_HEADERS = {"content-type": "application/json"}
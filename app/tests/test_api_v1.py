@@ -1,4 +1,3 @@
-import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
 from datetime import datetime, timedelta, timezone
@@ -68,7 +67,6 @@ async def generate_test_data(async_session):
     # Return the agent ID and list of events
     return {"agent_id": agent_id, "events": events}
 
-@pytest.mark.asyncio
 async def test_list_agents(generate_test_data, test_client):
     """Test listing agents endpoint."""
     agent_id = generate_test_data["agent_id"]
@@ -88,7 +86,6 @@ async def test_list_agents(generate_test_data, test_client):
     assert "last_seen" in test_agent
     assert "status" in test_agent
 
-@pytest.mark.asyncio
 async def test_get_agent_details(generate_test_data, test_client):
     """Test getting agent details endpoint."""
     agent_id = generate_test_data["agent_id"]
@@ -103,7 +100,6 @@ async def test_get_agent_details(generate_test_data, test_client):
     assert "latest_event" in data
     assert "first_event" in data
 
-@pytest.mark.asyncio
 async def test_get_agent_events(generate_test_data, test_client):
     """Test getting agent events endpoint."""
     agent_id = generate_test_data["agent_id"]
@@ -127,7 +123,6 @@ async def test_get_agent_events(generate_test_data, test_client):
     assert all(e["event_type"] == "model_response" for e in data["results"])
     assert len(data["results"]) <= 5
 
-@pytest.mark.asyncio
 async def test_get_agent_event(generate_test_data, test_client):
     """Test getting a specific agent event."""
     agent_id = generate_test_data["agent_id"]
@@ -143,7 +138,6 @@ async def test_get_agent_event(generate_test_data, test_client):
     assert "level" in data
     assert "event_type" in data
 
-@pytest.mark.asyncio
 async def test_get_agent_metrics(generate_test_data, test_client):
     """Test getting agent metrics endpoint."""
     agent_id = generate_test_data["agent_id"]
@@ -183,7 +177,6 @@ async def test_get_agent_metrics(generate_test_data, test_client):
     assert "metrics" in data
     assert data["metrics"]["type"] == "errors"
 
-@pytest.mark.asyncio
 async def test_get_alerts(generate_test_data, test_client):
     """Test getting alerts endpoint."""
     response = test_client.get("/api/v1/alerts/")
@@ -193,7 +186,6 @@ async def test_get_alerts(generate_test_data, test_client):
     assert "results" in data
     assert "pagination" in data
 
-@pytest.mark.asyncio
 async def test_get_alert_details(generate_test_data, test_client, async_session):
     """Test getting a specific alert."""
     agent_id = generate_test_data["agent_id"]
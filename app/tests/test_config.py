@@ -8,31 +8,51 @@ This module provides utilities for configuring different test environments:
 
 import os
 import sys
+import logging
+import sqlite3
 import tempfile
 from pathlib import Path
 
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
 # Constants for test database configuration
 TEST_DB_TYPE_MEMORY = "memory"
 TEST_DB_TYPE_FILE = "file"
 TEST_DB_DIR = "./data"
 TEST_DB_FILENAME = "test_cylestio.db"
 DEFAULT_TEST_DB_PATH = f"{TEST_DB_DIR}/{TEST_DB_FILENAME}"
+TEST_VERBOSE_ENV_VAR = "CYLESTIO_TEST_VERBOSE"
+
+# Environment variables cleared by reset_test_environment()
+_RESET_KEYS = (
+    "CYLESTIO_TEST_MODE",
+    "CYLESTIO_TEST_DB_TYPE",
+    "CYLESTIO_DB_PATH",
+    "CYLESTIO_PRESERVE_TEST_DB",
+    "CYLESTIO_RESET_TEST_DB",
+)
 
 def get_project_root():
     """Get the absolute path to the project root directory."""
     # The test_config.py file is in app/tests, so go up two directories
     return Path(__file__).parent.parent.parent.absolute()
 
+def configure_test_logging():
+    """Enable debug logging for test helpers when CYLESTIO_TEST_VERBOSE is set."""
+    if os.environ.get(TEST_VERBOSE_ENV_VAR, "").lower() in ("1", "true"):
+        logging.basicConfig(level=logging.DEBUG)
+
 def setup_memory_db():
     """Configure environment for in-memory database testing (unit tests)."""
     os.environ["CYLESTIO_TEST_MODE"] = "true"
     os.environ["CYLESTIO_TEST_DB_TYPE"] = TEST_DB_TYPE_MEMORY
     
     # Clear any existing DB_PATH to ensure we use the in-memory DB
-    if "CYLESTIO_DB_PATH" in os.environ:
-        del os.environ["CYLESTIO_DB_PATH"]
+    os.environ.pop("CYLESTIO_DB_PATH", None)
     
-    print("Test environment configured for in-memory database (unit tests)")
+    logger.debug("Test environment configured for in-memory database (unit tests)")
     return ":memory:"
 
 def setup_file_db(db_path=None, preserve_db=True):
@@ -69,12 +89,11 @@ def setup_file_db(db_path=None, preserve_db=True):
     
     # Create an empty database file if it doesn't exist to ensure permissions are correct
     if not os.path.exists(db_path) or os.path.getsize(db_path) == 0:
-        print(f"Creating new test database file at {db_path}")
-        import sqlite3
+        logger.debug(f"Creating new test database file at {db_path}")
         conn = sqlite3.connect(db_path)
         conn.close()
     
-    print(f"Test environment configured for file-based database (integration tests) at {db_path}")
+    logger.debug(f"Test environment configured for file-based database (integration tests) at {db_path}")
     return db_path
 
 def get_test_db_path():
@@ -95,8 +114,34 @@ def should_preserve_db():
 
 def reset_test_environment():
     """Reset test environment variables to their defaults."""
-    for key in ["CYLESTIO_TEST_MODE", "CYLESTIO_TEST_DB_TYPE", 
-                "CYLESTIO_DB_PATH", "CYLESTIO_PRESERVE_TEST_DB",
-                "CYLESTIO_RESET_TEST_DB"]:
-        if key in os.environ:
-            del os.environ[key] 
\ No newline at end of file
+    for key in _RESET_KEYS:
+        os.environ.pop(key, None) 
+
+def set_fast_sqlite_pragmas(dbapi_connection):
+    """Turn off SQLite durability work that test databases don't need."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+def use_explicit_begin(engine):
+    """Make a SQLite test engine begin its transactions explicitly.
+    
+    The sqlite3 driver defers BEGIN until the first write, so an outer
+    per-test transaction would not really wrap the savepoints taken inside
+    it, and their commits could not be rolled back. This turns off the
+    driver's own transaction handling and emits BEGIN from a begin listener.
+    
+    Args:
+        engine: A SQLAlchemy Engine or AsyncEngine for a SQLite database
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    
+    @event.listens_for(sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
\ No newline at end of file
@@ -1,10 +1,10 @@
 import asyncio
 import json
+import logging
 import sys
 import os
 import datetime
 from pathlib import Path
-import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.pool import NullPool
@@ -17,6 +17,9 @@ from app.models.agent import Agent
 from app.models.event import Event
 from app.models.session import Session
 from app.routers.event_create import create_event
+from app.tests.test_config import configure_test_logging
+
+logger = logging.getLogger(__name__)
 
 @pytest_asyncio.fixture(scope="function")
 async def db_session():
@@ -30,10 +33,10 @@ async def db_session():
 async def load_sample_data(sample_file_path):
     """Load sample data from a JSON file."""
     if not os.path.exists(sample_file_path):
-        print(f"Sample file {sample_file_path} not found.")
+        logger.debug(f"Sample file {sample_file_path} not found.")
         return
     
-    print(f"Loading sample data from {sample_file_path}...")
+    logger.debug(f"Loading sample data from {sample_file_path}...")
     
     # Read the JSON file
     with open(sample_file_path, "r") as f:
@@ -50,18 +53,17 @@ async def load_sample_data(sample_file_path):
                     await create_event(event_data, session)
                     
                     if (i + 1) % 10 == 0:
-                        print(f"Processed {i + 1} records...")
+                        logger.debug(f"Processed {i + 1} records...")
                     
                 except json.JSONDecodeError as e:
-                    print(f"Error parsing JSON on line {i + 1}: {e}")
+                    logger.error(f"Error parsing JSON on line {i + 1}: {e}")
                 except Exception as e:
-                    print(f"Error processing event on line {i + 1}: {e}")
+                    logger.error(f"Error processing event on line {i + 1}: {e}")
         finally:
             await session.close()
     
-    print("Sample data loading complete.")
+    logger.debug("Sample data loading complete.")
 
-@pytest.mark.asyncio
 async def test_queries(db_session: AsyncSession):
     """Test basic database queries."""
     # Add your test queries here
@@ -70,7 +72,7 @@ async def test_queries(db_session: AsyncSession):
 async def main():
     """Main test function."""
     # Create tables
-    print("Creating database tables...")
+    logger.debug("Creating database tables...")
     await init_db()
     
     # Load sample data from input_json_records_examples
@@ -82,10 +84,11 @@ async def main():
             if sample_file.endswith(".json"):
                 await load_sample_data(sample_files_dir / sample_file)
     else:
-        print(f"Sample files directory {sample_files_dir} not found.")
+        logger.debug(f"Sample files directory {sample_files_dir} not found.")
     
     # Run test queries
     await test_queries(None)  # Note: This is just for manual testing
 
 if __name__ == "__main__":
+    configure_test_logging()
     asyncio.run(main()) 
\ No newline at end of file
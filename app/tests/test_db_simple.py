@@ -9,6 +9,7 @@ This file tests the basic functionality of our database configuration:
 
 import os
 import sys
+import hashlib
 import pytest
 import asyncio
 import sqlite3
@@ -16,6 +17,7 @@ from pathlib import Path
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # Ensure we can import from the correct path
 ROOT_DIR = Path(__file__).parent.parent.parent
@@ -24,17 +26,31 @@ sys.path.insert(0, str(ROOT_DIR))
 # Import our configuration utilities
 from app.tests.test_config import setup_memory_db, setup_file_db, get_test_db_path
 
+# Schema of the file-based test table; its hash is stored in the pytest cache so
+# that `--cached` runs can reuse the database file instead of rebuilding it.
+TEST_TABLE_SCHEMA = "CREATE TABLE IF NOT EXISTS test_table (id INTEGER PRIMARY KEY, value TEXT)"
+TEST_TABLE_SCHEMA_HASH = hashlib.sha256(TEST_TABLE_SCHEMA.encode()).hexdigest()
+SCHEMA_HASH_CACHE_KEY = "cylestio/sqlite_schema_hash"
+
+# Environment variables set by setup_memory_db and setup_file_db
+TEST_DB_ENV_KEYS = (
+    "CYLESTIO_TEST_MODE",
+    "CYLESTIO_TEST_DB_TYPE",
+    "CYLESTIO_DB_PATH",
+    "CYLESTIO_PRESERVE_TEST_DB",
+)
+
 # Ensure data directory exists
 data_dir = ROOT_DIR / "data"
 data_dir.mkdir(exist_ok=True)
 
-# Set up environment for in-memory testing
-setup_memory_db()
-
-# Create engine and session for in-memory database
+# Create engine and session for in-memory database; StaticPool pins every
+# session to one connection, so they share both the database and the single
+# aiosqlite worker thread
 engine = create_async_engine(
     "sqlite+aiosqlite:///:memory:",
     echo=False,
+    poolclass=StaticPool,
     connect_args={"check_same_thread": False},
 )
 
@@ -44,8 +60,19 @@ SessionLocal = sessionmaker(
     class_=AsyncSession,
 )
 
-@pytest.mark.asyncio
-async def test_in_memory_db_basic():
+@pytest.fixture
+def db_env(monkeypatch):
+    """Restore the test database environment variables after each test."""
+    # Other modules on the same xdist worker may have set these, so start clean
+    for key in TEST_DB_ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
+@pytest.fixture
+def memory_db_env(db_env):
+    """Configure the environment for the in-memory database."""
+    return setup_memory_db()
+
+async def test_in_memory_db_basic(memory_db_env):
     """Test basic in-memory database operations."""
     # Get the configured database path
     db_path = get_test_db_path()
@@ -73,15 +100,26 @@ async def test_in_memory_db_basic():
     print("In-memory database basic test passed - operations work correctly.")
 
 # Now set up environment for file-based testing
-@pytest.mark.asyncio
-async def test_file_based_db_basic():
+async def test_file_based_db_basic(pytestconfig, db_env):
     """Test basic file-based database operations."""
     # Set up file-based database with absolute path
     test_db_path = str(ROOT_DIR / "data" / "simple_test.db")
     
-    # Create an empty SQLite database file
-    con = sqlite3.connect(test_db_path)
-    con.close()
+    # With --cached, reuse the database from a previous run if its schema is unchanged
+    cache = getattr(pytestconfig, "cache", None)
+    reuse_db = (
+        pytestconfig.getoption("--cached", default=False)
+        and cache is not None
+        and os.path.exists(test_db_path)
+        and cache.get(SCHEMA_HASH_CACHE_KEY, None) == TEST_TABLE_SCHEMA_HASH
+    )
+    
+    if not reuse_db:
+        # Start from a fresh, empty SQLite database file
+        if os.path.exists(test_db_path):
+            os.remove(test_db_path)
+        con = sqlite3.connect(test_db_path)
+        con.close()
     
     # Verify the file was created
     assert os.path.exists(test_db_path), f"Database file {test_db_path} should exist"
@@ -106,12 +144,15 @@ async def test_file_based_db_basic():
     )
     
     # Create a test table
-    async with file_engine.begin() as conn:
-        await conn.execute(text("CREATE TABLE IF NOT EXISTS test_table (id INTEGER PRIMARY KEY, value TEXT)"))
+    if not reuse_db:
+        async with file_engine.begin() as conn:
+            await conn.execute(text(TEST_TABLE_SCHEMA))
+        if cache is not None:
+            cache.set(SCHEMA_HASH_CACHE_KEY, TEST_TABLE_SCHEMA_HASH)
     
     # Insert data
     async with FileSessionLocal() as session:
-        await session.execute(text("INSERT INTO test_table (id, value) VALUES (2, 'file-based value')"))
+        await session.execute(text("INSERT OR REPLACE INTO test_table (id, value) VALUES (2, 'file-based value')"))
         await session.commit()
     
     # Query data
@@ -135,6 +176,22 @@ async def test_file_based_db_basic():
     assert direct_value == "file-based value", "Direct database access should work"
     print("Direct SQLite access to file verified successfully")
 
+def test_cached_option_from_repo_root(pytester):
+    """Test that `--cached` is recognised for tests below the repository root."""
+    # A plain `pytest` run only loads the root conftest before parsing the
+    # command line, so mirror that layout with the option read two levels down
+    pytester.makeconftest((ROOT_DIR / "conftest.py").read_text())
+    pytester.makepyfile(**{
+        "app/tests/test_reads_cached": """
+            def test_reads_cached(pytestconfig):
+                assert pytestconfig.getoption("--cached")
+        """
+    })
+    
+    result = pytester.runpytest("--cached", "-p", "no:xdist")
+    
+    result.assert_outcomes(passed=1)
+
 if __name__ == "__main__":
     # Run this specific test file with pytest directly
     pytest.main(["-xvs", __file__]) 
\ No newline at end of file
@@ -5,12 +5,12 @@ This module contains tests for the EventProcessor that coordinates
 processing events through the business logic layer.
 """
 
-import pytest
 import asyncio
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import MagicMock
 
 from app.business_logic.event_processor import EventProcessor
 from app.business_logic.extractors.base import BaseExtractor
+from app.tests.fakes import FakeEvent, FakeSession
 
 
 class MockExtractor(BaseExtractor):
@@ -27,53 +27,78 @@ class MockExtractor(BaseExtractor):
         self.processed_events.append(event)
 
 
+class RaisingExtractor(BaseExtractor):
+    """Extractor that fails on the given event ids, or on every event if none are given."""
+    
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.process_calls = 0
+    
+    def can_process(self, event):
+        return True
+    
+    async def process(self, event, db_session):
+        self.process_calls += 1
+        if self.fail_on is None or event.id in self.fail_on:
+            raise Exception("Test exception")
+
+
+class FailingCommitSession(FakeSession):
+    """FakeSession whose commit always fails."""
+    
+    async def commit(self):
+        await super().commit()
+        raise Exception("Commit failed")
+
+
 class TestEventProcessor:
     """Tests for the EventProcessor."""
     
-    @pytest.mark.asyncio
-    async def test_process_event(self):
-        """Test processing a single event."""
-        # Create mock event and DB session
-        event = MagicMock()
-        event.id = 1
-        event.event_type = "test_event"
-        db_session = AsyncMock()
-        
-        # Create mock extractors
+    async def test_process_event_scenarios(self):
+        """Test processing events with succeeding and failing extractors."""
+        # Scenario 1: extractors that succeed, one of which does not apply
+        event = FakeEvent(1, "test_event")
+        db_session = FakeSession()
         extractor1 = MockExtractor(can_process_result=True)
         extractor2 = MockExtractor(can_process_result=False)
         extractor3 = MockExtractor(can_process_result=True)
-        
-        # Create processor with mock extractors
         processor = EventProcessor(extractors=[extractor1, extractor2, extractor3])
         
-        # Process the event
-        await processor.process_event(event, db_session)
+        # Scenario 2: an extractor that raises an exception on the event processing step
+        failing_event = FakeEvent(2, "test_event")
+        failing_session = FakeSession()
+        raising_extractor = RaisingExtractor()
+        failing_processor = EventProcessor(extractors=[raising_extractor])
+        
+        # Process both events concurrently
+        result, failing_result = await asyncio.gather(
+            processor.process_event(event, db_session),
+            failing_processor.process_event(failing_event, failing_session)
+        )
         
         # Verify extractors were called correctly
         assert event in extractor1.processed_events
         assert event not in extractor2.processed_events
         assert event in extractor3.processed_events
+        assert raising_extractor.process_calls == 1
         
-        # Verify event was marked as processed
+        # Verify the successful event was marked as processed and committed
+        assert result is event
         assert event.is_processed is True
+        assert db_session.commit_calls == 1
         
-        # Verify session was committed
-        db_session.commit.assert_called_once()
+        # Verify the failing event's transaction was rolled back, not committed
+        assert failing_result is None
+        assert failing_event.is_processed is False
+        assert failing_session.commit_calls == 0
+        assert failing_session.rollback_calls == 1
     
-    @pytest.mark.asyncio
     async def test_process_events(self):
         """Test processing multiple events."""
-        # Create mock events and DB session
-        event1 = MagicMock()
-        event1.id = 1
-        event1.event_type = "test_event_1"
-        
-        event2 = MagicMock()
-        event2.id = 2
-        event2.event_type = "test_event_2"
-        
-        db_session = AsyncMock()
+        # Create fake events and DB session
+        event1 = FakeEvent(1, "test_event_1")
+        event2 = FakeEvent(2, "test_event_2")
+        db_session = FakeSession()
         
         # Create mock extractor
         extractor = MockExtractor(can_process_result=True)
@@ -97,59 +122,73 @@ class TestEventProcessor:
         assert event1.is_processed is True
         assert event2.is_processed is True
         
-        # Verify session was committed twice (once per event)
-        assert db_session.commit.call_count == 2
+        # Verify session was committed once for the whole batch
+        assert db_session.commit_calls == 1
     
-    @pytest.mark.asyncio
-    async def test_process_event_with_exception(self):
-        """Test processing an event that raises an exception."""
-        # Create mock event and DB session
-        event = MagicMock()
-        event.id = 1
-        event.event_type = "test_event"
-        db_session = AsyncMock()
-        
-        # Create mock extractor that raises an exception on the event processing step
-        mock_extractor = AsyncMock(spec=BaseExtractor)
-        mock_extractor.can_process.return_value = True
-        mock_extractor.process.side_effect = Exception("Test exception")
-        mock_extractor.get_name.return_value = "MockExtractor"
-        
-        # Create processor with mock extractor
-        processor = EventProcessor(extractors=[mock_extractor])
-        
-        # Process the event - should log the error but continue execution
-        await processor.process_event(event, db_session)
-        
-        # Verify extractor was called
-        mock_extractor.process.assert_called_once()
+    async def test_process_events_batches_commit(self):
+        """Test that a large batch of events is committed only once."""
+        events = [FakeEvent(i, "test_event") for i in range(100)]
+        db_session = FakeSession()
+        
+        processor = EventProcessor(extractors=[MockExtractor(can_process_result=True)])
+        result = await processor.process_events(events, db_session)
+        
+        # Every event runs in its own savepoint but shares a single commit
+        assert len(result) == 100
+        assert db_session.savepoint_calls == 100
+        assert db_session.commit_calls == 1
+    
+    async def test_process_events_isolates_failing_event(self):
+        """Test that an extractor failure mid-batch only rolls back that event."""
+        events = [FakeEvent(i, "test_event") for i in range(5)]
+        db_session = FakeSession()
+        
+        processor = EventProcessor(extractors=[
+            MockExtractor(can_process_result=True),
+            RaisingExtractor(fail_on={2}),
+        ])
+        result = await processor.process_events(events, db_session)
+        
+        # Only the failing event's savepoint is rolled back
+        assert db_session.savepoint_calls == 5
+        assert db_session.savepoint_rollback_calls == 1
+        assert events[2].is_processed is False
+        
+        # The other events are returned and committed together
+        assert result == [events[0], events[1], events[3], events[4]]
+        assert all(event.is_processed for event in result)
+        assert db_session.commit_calls == 1
+        assert db_session.rollback_calls == 0
+    
+    async def test_process_events_commit_failure(self):
+        """Test that a failed batch commit is rolled back and reported as empty."""
+        events = [FakeEvent(i, "test_event") for i in range(3)]
+        db_session = FailingCommitSession()
         
-        # Verify event was still marked as processed
-        assert event.is_processed is True
+        processor = EventProcessor(extractors=[MockExtractor(can_process_result=True)])
+        result = await processor.process_events(events, db_session)
         
-        # Verify session was still committed
-        db_session.commit.assert_called_once()
+        assert result == []
+        assert db_session.commit_calls == 1
+        assert db_session.rollback_calls == 1
 
 
-@pytest.mark.asyncio
 async def test_get_extractors_for_event_type():
     """Test getting extractors for a specific event type."""
     # Create mock registry with mock extractors
     mock_registry = MagicMock()
     mock_registry.get_extractors_for_event.return_value = ["extractor1", "extractor2"]
     
-    # Patch the extractor_registry
-    with patch("app.business_logic.event_processor.extractor_registry", mock_registry):
-        # Get extractors for event type
-        result = await EventProcessor.get_extractors_for_event_type("test_event")
-        
-        # Verify registry was called correctly
-        mock_registry.get_extractors_for_event.assert_called_once()
-        
-        # Verify the mock event had the correct event_type
-        args, _ = mock_registry.get_extractors_for_event.call_args
-        mock_event = args[0]
-        assert mock_event.event_type == "test_event"
-        
-        # Verify correct extractors were returned
-        assert result == ["extractor1", "extractor2"] 
\ No newline at end of file
+    # Get extractors for event type from the injected registry
+    result = await EventProcessor.get_extractors_for_event_type("test_event", registry=mock_registry)
+    
+    # Verify registry was called correctly
+    mock_registry.get_extractors_for_event.assert_called_once()
+    
+    # Verify the lookup event had the correct event_type
+    args, _ = mock_registry.get_extractors_for_event.call_args
+    lookup_event = args[0]
+    assert lookup_event.event_type == "test_event"
+    
+    # Verify correct extractors were returned
+    assert result == ["extractor1", "extractor2"]
\ No newline at end of file
@@ -8,46 +8,77 @@ of using the extraction framework.
 import pytest
 from datetime import datetime, timezone
 import json
-from unittest.mock import AsyncMock, MagicMock
+from types import MappingProxyType
 
 from app.business_logic.extractors import UserActivityExtractor
 from app.models.event import Event
+from app.tests.fakes import FakeSession
+
+
+# Event timestamps shared by the fixtures
+_UTC = timezone.utc
+TS_LOGIN = datetime(2023, 1, 1, 12, 0, 0, tzinfo=_UTC)
+TS_ACTION = datetime(2023, 1, 1, 13, 0, 0, tzinfo=_UTC)
+TS_AUDIT = datetime(2023, 1, 1, 14, 0, 0, tzinfo=_UTC)
+ISO_LOGIN = "2023-01-01T12:00:00Z"
+ISO_ACTION = "2023-01-01T13:00:00Z"
+ISO_AUDIT = "2023-01-01T14:00:00Z"
+
+# Payload of the audit event; nested values are never mutated by the tests
+_AUDIT_BASE_DATA = {
+    "audit": {
+        "action": "data_access",
+        "timestamp": ISO_AUDIT,
+        "actor": {
+            "id": "user123",
+            "type": "user"
+        },
+        "resource": {
+            "id": "resource456",
+            "type": "document"
+        },
+        "access_type": "read"
+    }
+}
 
 
 # Test data fixtures
-@pytest.fixture
+# Read-only events are shared across the module and their data is wrapped in a
+# MappingProxyType so accidental mutation fails loudly; events that tests
+# mutate stay function-scoped so every test gets a fresh copy.
+@pytest.fixture(scope="module")
 def user_login_event():
     """Create a user login event fixture."""
     return Event(
         id="event1",
         event_type="user_login",
-        timestamp=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-        data={
+        timestamp=TS_LOGIN,
+        data=MappingProxyType({
             "user": {
                 "id": "user123",
                 "username": "test_user",
                 "email": "user@example.com"
             },
-            "timestamp": "2023-01-01T12:00:00Z",
+            "timestamp": ISO_LOGIN,
             "source_ip": "192.168.1.1",
             "device": "web",
             "success": True
-        }
+        })
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def user_action_event():
     """Create a user action event fixture."""
     return Event(
         id="event2",
         event_type="user_action",
-        timestamp=datetime(2023, 1, 1, 13, 0, 0, tzinfo=timezone.utc),
-        data={
+        timestamp=TS_ACTION,
+        data=MappingProxyType({
             "user_id": "user123",
             "username": "test_user",
             "action": "profile_update",
-            "timestamp": "2023-01-01T13:00:00Z",
+            "timestamp": ISO_ACTION,
             "details": {
                 "fields_updated": ["name", "photo"],
                 "previous_values": {
@@ -57,65 +88,53 @@ def user_action_event():
                     "name": "New Name"
                 }
             }
-        }
+        })
     )
 
 
 @pytest.fixture
 def different_structure_event():
     """Create an event with a different structure but still containing user data."""
+    # Tests only add top-level keys, so a shallow copy of the shared payload
+    # keeps them isolated from each other
     return Event(
         id="event3",
         event_type="audit_log",
-        timestamp=datetime(2023, 1, 1, 14, 0, 0, tzinfo=timezone.utc),
-        data={
-            "audit": {
-                "action": "data_access",
-                "timestamp": "2023-01-01T14:00:00Z",
-                "actor": {
-                    "id": "user123",
-                    "type": "user"
-                },
-                "resource": {
-                    "id": "resource456",
-                    "type": "document"
-                },
-                "access_type": "read"
-            }
-        }
+        timestamp=TS_AUDIT,
+        data={**_AUDIT_BASE_DATA}
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def extractor():
+    """Create a UserActivityExtractor shared by the tests in this module."""
+    return UserActivityExtractor()
+
+
+@pytest.fixture(scope="module")
 def db_session():
-    """Create a mock database session."""
-    return MagicMock()
+    """Create a database session that stores nothing."""
+    return FakeSession()
 
 
 class TestUserActivityExtractor:
     """Tests for the UserActivityExtractor class."""
     
-    def test_can_process_user_event_types(self, user_login_event, user_action_event):
+    def test_can_process_user_event_types(self, extractor, user_login_event, user_action_event):
         """Test that the extractor can process user-related event types."""
-        extractor = UserActivityExtractor()
-        
         assert extractor.can_process(user_login_event) is True
         assert extractor.can_process(user_action_event) is True
     
-    def test_can_process_different_structure(self, different_structure_event):
+    def test_can_process_different_structure(self, extractor, different_structure_event):
         """Test that the extractor can process events with a different structure containing user data."""
-        extractor = UserActivityExtractor()
-        
         # Need to adjust the fixture to include a valid user ID path
         different_structure_event.data["account"] = {"user": {"id": "user123"}}
         
         # The extractor should detect that this event has user data despite being a different type
         assert extractor.can_process(different_structure_event) is True
     
-    def test_can_process_non_user_event(self):
+    def test_can_process_non_user_event(self, extractor):
         """Test that the extractor rejects events without user data."""
-        extractor = UserActivityExtractor()
-        
         # Create a non-user event
         non_user_event = Event(
             id="event4",
@@ -130,121 +149,108 @@ class TestUserActivityExtractor:
         
         assert extractor.can_process(non_user_event) is False
     
-    def test_extract_user_data_standard_format(self, user_login_event):
-        """Test extracting user data from standard format."""
-        extractor = UserActivityExtractor()
-        
-        user_data = extractor._extract_user_data(user_login_event.data)
-        
-        assert user_data["user_id"] == "user123"
-        assert user_data["username"] == "test_user"
-        assert user_data["email"] == "user@example.com"
-    
-    def test_extract_user_data_flat_format(self, user_action_event):
-        """Test extracting user data from flat format."""
-        extractor = UserActivityExtractor()
-        
-        user_data = extractor._extract_user_data(user_action_event.data)
-        
-        assert user_data["user_id"] == "user123"
-        assert user_data["username"] == "test_user"
-    
-    def test_extract_user_data_nested_format(self, different_structure_event):
-        """Test extracting user data from nested format."""
-        extractor = UserActivityExtractor()
-        
-        # Adjust data to include a valid user ID path
-        different_structure_event.data["account"] = {"user": {"id": "user123"}}
-        
-        user_data = extractor._extract_user_data(different_structure_event.data)
+    @pytest.mark.parametrize("event_name,extra_data,expected_user_data", [
+        # Standard format
+        ("user_login_event", {}, {
+            "user_id": "user123",
+            "username": "test_user",
+            "email": "user@example.com"
+        }),
+        # Flat format
+        ("user_action_event", {}, {
+            "user_id": "user123",
+            "username": "test_user"
+        }),
+        # Nested format with a valid user ID path overlaid on the event data;
+        # it only has the user id, not a username
+        ("different_structure_event", {"account": {"user": {"id": "user123"}}}, {
+            "user_id": "user123"
+        }),
+    ])
+    def test_extract_user_data(self, request, extractor, event_name, extra_data, expected_user_data):
+        """Test extracting user data from standard, flat and nested formats."""
+        event = request.getfixturevalue(event_name)
+        user_data = extractor._extract_user_data({**event.data, **extra_data})
         
-        assert user_data["user_id"] == "user123"
-        # The nested format only has user id, not username
-        assert "username" not in user_data
+        for key, value in expected_user_data.items():
+            assert user_data[key] == value
+        if "username" not in expected_user_data:
+            assert "username" not in user_data
     
-    def test_extract_activity_timestamp(self, user_login_event, user_action_event, different_structure_event):
+    @pytest.mark.parametrize("event_name,expected_hour", [
+        # Timestamp in event data
+        ("user_login_event", 12),
+        # Timestamp in a different location
+        ("user_action_event", 13),
+        # Timestamp in a deeply nested location
+        ("different_structure_event", 14),
+    ])
+    def test_extract_activity_timestamp(self, request, extractor, event_name, expected_hour):
         """Test extracting the activity timestamp from various formats."""
-        extractor = UserActivityExtractor()
-        
-        # Test with timestamp in event data
-        timestamp1 = extractor._extract_activity_timestamp(user_login_event)
-        assert timestamp1.year == 2023
-        assert timestamp1.month == 1
-        assert timestamp1.day == 1
-        assert timestamp1.hour == 12
-        assert timestamp1.minute == 0
-        
-        # Test with timestamp in a different location
-        timestamp2 = extractor._extract_activity_timestamp(user_action_event)
-        assert timestamp2.year == 2023
-        assert timestamp2.month == 1
-        assert timestamp2.day == 1
-        assert timestamp2.hour == 13
-        assert timestamp2.minute == 0
+        event = request.getfixturevalue(event_name)
         
-        # Test with timestamp in a deeply nested location
-        timestamp3 = extractor._extract_activity_timestamp(different_structure_event)
-        assert timestamp3.year == 2023
-        assert timestamp3.month == 1
-        assert timestamp3.day == 1
-        assert timestamp3.hour == 14
-        assert timestamp3.minute == 0
+        timestamp = extractor._extract_activity_timestamp(event)
+        assert timestamp.year == 2023
+        assert timestamp.month == 1
+        assert timestamp.day == 1
+        assert timestamp.hour == expected_hour
+        assert timestamp.minute == 0
     
-    def test_extract_activity_type(self, user_login_event, user_action_event, different_structure_event):
-        """Test extracting the activity type from different event formats."""
-        extractor = UserActivityExtractor()
-        
+    @pytest.mark.parametrize("event_name,extra_data,expected_type", [
         # Login event
-        activity_type1 = extractor._extract_activity_type(user_login_event)
-        assert activity_type1 == "login"
-        
+        ("user_login_event", {}, "login"),
         # Action event - should use the "action" field
-        activity_type2 = extractor._extract_activity_type(user_action_event)
-        assert activity_type2 == "profile_update"
-        
+        ("user_action_event", {}, "profile_update"),
         # Audit event - falls back to event type
-        activity_type3 = extractor._extract_activity_type(different_structure_event)
-        assert activity_type3 == "audit_log"
+        ("different_structure_event", {}, "audit_log"),
+        # Audit event with "activity.type" to test that path
+        ("different_structure_event", {"activity": {"type": "data_access"}}, "data_access"),
+    ])
+    def test_extract_activity_type(self, request, extractor, event_name, extra_data, expected_type):
+        """Test extracting the activity type from different event formats."""
+        event = request.getfixturevalue(event_name)
+        if extra_data:
+            # Only the function-scoped audit event gets extra data; the shared
+            # events are read-only
+            event.data = {**event.data, **extra_data}
         
-        # Add "activity.type" to test that path
-        different_structure_event.data["activity"] = {"type": "data_access"}
-        activity_type4 = extractor._extract_activity_type(different_structure_event)
-        assert activity_type4 == "data_access"
+        assert extractor._extract_activity_type(event) == expected_type
     
-    def test_extract_activity_details(self, user_login_event, user_action_event, different_structure_event):
-        """Test extracting the activity details from various formats."""
-        extractor = UserActivityExtractor()
-        
+    @pytest.mark.parametrize("event_name,extra_data,expected_details", [
         # Login event details - should collect non-user fields
-        details1 = extractor._extract_activity_details(user_login_event.data)
-        assert details1["source_ip"] == "192.168.1.1"
-        assert details1["device"] == "web"
-        assert details1["success"] is True
-        
+        ("user_login_event", {}, {
+            "source_ip": "192.168.1.1",
+            "device": "web",
+            "success": True
+        }),
         # Action event details - should use the "details" field
-        details2 = extractor._extract_activity_details(user_action_event.data)
-        assert "fields_updated" in details2
-        assert details2["fields_updated"] == ["name", "photo"]
-        assert "previous_values" in details2
-        assert details2["previous_values"]["name"] == "Old Name"
-        
+        ("user_action_event", {}, {
+            "fields_updated": ["name", "photo"],
+            "previous_values": {"name": "Old Name"}
+        }),
         # Audit event details - add details field
-        different_structure_event.data["details"] = {
+        ("different_structure_event", {
+            "details": {
+                "resource_id": "resource456",
+                "resource_type": "document",
+                "access_type": "read"
+            }
+        }, {
             "resource_id": "resource456",
             "resource_type": "document",
             "access_type": "read"
-        }
-        details3 = extractor._extract_activity_details(different_structure_event.data)
-        assert details3["resource_id"] == "resource456"
-        assert details3["resource_type"] == "document"
-        assert details3["access_type"] == "read"
+        }),
+    ])
+    def test_extract_activity_details(self, request, extractor, event_name, extra_data, expected_details):
+        """Test extracting the activity details from various formats."""
+        event = request.getfixturevalue(event_name)
+        details = extractor._extract_activity_details({**event.data, **extra_data})
+        for key, value in expected_details.items():
+            assert details[key] == value
     
-    @pytest.mark.asyncio
-    async def test_process_user_activity(self, user_login_event, db_session):
+    @pytest.mark.slow
+    async def test_process_user_activity(self, extractor, user_login_event, db_session):
         """Test the process_user_activity method."""
-        extractor = UserActivityExtractor()
-        db_session.execute = AsyncMock()
-        
         # Manually extract the required data
         user_data = extractor._extract_user_data(user_login_event.data)
         timestamp = extractor._extract_activity_timestamp(user_login_event)
@@ -262,11 +268,9 @@ class TestUserActivityExtractor:
         )
         # In a real test, we would assert that the database was called with appropriate values
     
-    @pytest.mark.asyncio
-    async def test_process_full_event(self, user_login_event, db_session):
+    @pytest.mark.slow
+    async def test_process_full_event(self, extractor, user_login_event, db_session):
         """Test the full process method."""
-        extractor = UserActivityExtractor()
-        
         # Process the event
         await extractor.process(user_login_event, db_session)
         
@@ -7,7 +7,9 @@ and extraction utility functions.
 
 import pytest
 import json
+from collections import deque
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Dict, Any, List
 
 from app.business_logic.extractors.base import (
@@ -22,6 +24,7 @@ from app.business_logic.extractors.utils import (
     extract_datetime,
     extract_numeric_values,
     merge_dictionaries,
+    compile_schema,
     extract_schema_fields,
     get_nested_value
 )
@@ -31,8 +34,8 @@ class MockExtractor(BaseExtractor):
     """Mock extractor for testing."""
     
     def __init__(self, event_types=None):
-        self.event_types = event_types or ["test_event"]
-        self.processed_events = []
+        self.event_types = frozenset(event_types or ("test_event",))
+        self.processed_events = deque()
         
     def can_process(self, event) -> bool:
         return event.event_type in self.event_types
@@ -201,6 +204,29 @@ class TestExtractorRegistry:
         assert len(extractors2) == 1
         assert extractor2 in extractors2
     
+    def test_get_extractors_for_event_after_register(self):
+        """Test that extractors registered after a lookup are still found."""
+        registry = ExtractorRegistry()
+        extractor1 = MockExtractor(["type1"])
+        extractor2 = MockExtractor(["type1"])
+        
+        class MockEvent:
+            def __init__(self, event_type):
+                self.event_type = event_type
+        
+        event = MockEvent("type1")
+        
+        registry.register(extractor1)
+        assert registry.get_extractors_for_event(event) == [extractor1]
+        
+        # A new generic extractor is picked up by the next lookup
+        registry.register(extractor2)
+        assert registry.get_extractors_for_event(event) == [extractor1, extractor2]
+        
+        # Registering for the event type moves the extractor ahead of generic ones
+        registry.register_for_event_type("type1", extractor2)
+        assert registry.get_extractors_for_event(event) == [extractor2, extractor1]
+    
     def test_get_extractor_by_name(self):
         """Test getting an extractor by name."""
         registry = ExtractorRegistry()
@@ -353,6 +379,14 @@ class TestExtractionUtils:
         assert merged["b"]["d"] == 3  # Preserved
         assert merged["b"]["e"] == 5  # Added
         assert merged["f"] == 6  # Added
+        
+        # The input dictionaries are left untouched
+        assert dict1 == {"a": 1, "b": {"c": 2, "d": 3}}
+        
+        # In place
+        merged = merge_dictionaries(dict1, dict2, inplace=True)
+        assert merged is dict1
+        assert dict1 == {"a": 1, "b": {"c": 4, "d": 3, "e": 5}, "f": 6}
     
     def test_extract_schema_fields(self):
         """Test extracting fields based on a schema mapping."""
@@ -383,6 +417,22 @@ class TestExtractionUtils:
         assert extracted["age"] == 30
         assert extracted["email"] == "john@example.com"
         assert "phone" not in extracted  # No matching paths
+        
+        # A precompiled schema gives the same result
+        assert extract_schema_fields(data, compile_schema(schema)) == extracted
+        
+        # Paths may also be given pre-split into key tuples
+        split_schema = {
+            "name": ("person", "firstName"),
+            "surname": ("person", "lastName"),
+            "age": ("person", "details", "age"),
+            "phone": [("contact", "phone"), ("contact", "mobile")],
+            "email": ("contact", "email")
+        }
+        assert extract_schema_fields(data, split_schema) == extracted
+        
+        # Any read-only mapping is accepted as a schema, not just a dict
+        assert extract_schema_fields(data, MappingProxyType(schema)) == extracted
     
     def test_get_nested_value(self):
         """Test getting a nested value using a dot-notation path."""
@@ -5,7 +5,6 @@ This module contains tests for the extractors that normalize
 complex nested JSON data from events into dedicated relational models.
 """
 
-import pytest
 import asyncio
 from unittest.mock import MagicMock, AsyncMock
 import datetime
@@ -14,6 +13,7 @@ import json
 from app.business_logic.extractors.model_response_extractor import ModelResponseExtractor
 from app.business_logic.extractors.model_request_extractor import ModelRequestExtractor
 from app.business_logic.extractors.security_extractor import SecurityExtractor
+from app.tests.fakes import FakeEvent
 
 
 class TestModelResponseExtractor:
@@ -21,9 +21,8 @@ class TestModelResponseExtractor:
     
     def test_can_process(self):
         """Test that the extractor can process model_response events."""
-        # Create a mock event
-        event = MagicMock()
-        event.event_type = "model_response"
+        # Create a fake event
+        event = FakeEvent(event_type="model_response")
         
         # Create extractor
         extractor = ModelResponseExtractor()
@@ -35,14 +34,10 @@ class TestModelResponseExtractor:
         event.event_type = "model_request"
         assert extractor.can_process(event) is False
     
-    @pytest.mark.asyncio
     async def test_extract_token_usage(self):
         """Test extracting token usage from an event."""
-        # Create a mock event with token usage data
-        event = MagicMock()
-        event.id = 1
-        event.event_type = "model_response"
-        event.data = {
+        # Create a fake event with token usage data
+        event = FakeEvent(id=1, event_type="model_response", data={
             "llm_output": {
                 "model": "test-model",
                 "usage": {
@@ -50,16 +45,13 @@ class TestModelResponseExtractor:
                     "output_tokens": "101"
                 }
             }
-        }
-        
-        # Create mock DB session
-        db_session = AsyncMock()
+        })
         
         # Create extractor
         extractor = ModelResponseExtractor()
         
         # Call the method
-        token_usage = await extractor._extract_token_usage(event, db_session)
+        token_usage = await extractor._extract_token_usage(event)
         
         # Verify the result
         assert token_usage is not None
@@ -68,41 +60,60 @@ class TestModelResponseExtractor:
         assert token_usage.output_tokens == 101
         assert token_usage.total_tokens == 130
         assert token_usage.model == "test-model"
-        
-        # Verify the session was used
-        db_session.add.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_extract_performance_metrics(self):
         """Test extracting performance metrics from an event."""
-        # Create a mock event with performance data
-        event = MagicMock()
-        event.id = 1
-        event.event_type = "model_response"
-        event.data = {
+        # Create a fake event with performance data
+        event = FakeEvent(id=1, event_type="model_response", data={
             "performance": {
                 "duration_ms": "1500.5",
                 "timestamp": "2025-03-17T14:08:11.006702"
             }
-        }
-        
-        # Create mock DB session
-        db_session = AsyncMock()
+        })
         
         # Create extractor
         extractor = ModelResponseExtractor()
         
         # Call the method
-        perf_metric = await extractor._extract_performance_metrics(event, db_session)
+        perf_metric = await extractor._extract_performance_metrics(event)
         
         # Verify the result
         assert perf_metric is not None
         assert perf_metric.event_id == 1
         assert perf_metric.duration_ms == 1500.5
         assert perf_metric.timestamp is not None
+    
+    async def test_process_adds_all_extracted_rows(self):
+        """Test that process adds every extracted row to the session in one call."""
+        # Create a fake event with token usage and performance data
+        event = FakeEvent(id=1, event_type="model_response", data={
+            "llm_output": {
+                "model": "test-model",
+                "usage": {
+                    "input_tokens": 29,
+                    "output_tokens": 101
+                }
+            },
+            "performance": {
+                "duration_ms": 1500.5
+            }
+        })
         
-        # Verify the session was used
-        db_session.add.assert_called_once()
+        # Create mock DB session
+        db_session = MagicMock()
+        
+        # Create extractor
+        extractor = ModelResponseExtractor()
+        
+        # Process the event
+        await extractor.process(event, db_session)
+        
+        # Verify the rows were added in a single batch
+        db_session.add.assert_not_called()
+        db_session.add_all.assert_called_once()
+        token_usage, perf_metric = db_session.add_all.call_args[0][0]
+        assert token_usage.total_tokens == 130
+        assert perf_metric.duration_ms == 1500.5
 
 
 class TestModelRequestExtractor:
@@ -110,9 +121,8 @@ class TestModelRequestExtractor:
     
     def test_can_process(self):
         """Test that the extractor can process model_request events."""
-        # Create a mock event
-        event = MagicMock()
-        event.event_type = "model_request"
+        # Create a fake event
+        event = FakeEvent(event_type="model_request")
         
         # Create extractor
         extractor = ModelRequestExtractor()
@@ -124,14 +134,10 @@ class TestModelRequestExtractor:
         event.event_type = "model_response"
         assert extractor.can_process(event) is False
     
-    @pytest.mark.asyncio
     async def test_extract_framework_details(self):
         """Test extracting framework details from an event."""
-        # Create a mock event with framework data
-        event = MagicMock()
-        event.id = 1
-        event.event_type = "model_request"
-        event.data = {
+        # Create a fake event with framework data
+        event = FakeEvent(id=1, event_type="model_request", data={
             "framework": {
                 "name": "langchain",
                 "version": "0.3.44",
@@ -142,7 +148,7 @@ class TestModelRequestExtractor:
                 }
             },
             "framework_version": "0.3.44"
-        }
+        })
         
         # Create mock DB session
         db_session = AsyncMock()
@@ -170,13 +176,12 @@ class TestSecurityExtractor:
     
     def test_can_process(self):
         """Test that the extractor can process events with security data."""
-        # Create a mock event with security data
-        event = MagicMock()
-        event.data = {
+        # Create a fake event with security data
+        event = FakeEvent(data={
             "security": {
                 "alert_level": "none"
             }
-        }
+        })
         
         # Create extractor
         extractor = SecurityExtractor()
@@ -188,14 +193,10 @@ class TestSecurityExtractor:
         event.data = {}
         assert extractor.can_process(event) is False
     
-    @pytest.mark.asyncio
     async def test_extract_security_alerts(self):
         """Test extracting security alerts from an event."""
-        # Create a mock event with security data
-        event = MagicMock()
-        event.id = 1
-        event.event_type = "model_request"
-        event.data = {
+        # Create a fake event with security data
+        event = FakeEvent(id=1, event_type="model_request", data={
             "security": {
                 "alert_level": "warning",
                 "field_checks": {
@@ -207,7 +208,7 @@ class TestSecurityExtractor:
                     }
                 }
             }
-        }
+        })
         
         # Create mock DB session
         db_session = AsyncMock()
@@ -20,9 +20,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from app.tests.test_config import setup_memory_db, get_test_db_path
 from app.models.base import Base
 
-# Mark test module to use asyncio
-pytestmark = [pytest.mark.asyncio]
-
 @pytest.fixture(autouse=True, scope="module")
 def setup_test():
     """Automatically setup the test environment."""
@@ -38,14 +35,12 @@ async def test_in_memory_db_setup(setup_unit_test_env, unit_test_session):
     # Verify we're using in-memory database
     assert db_path == ":memory:", "Should be using an in-memory database"
     
-    # Get database inspector to check schema
-    inspector = await unit_test_session.run_sync(
-        lambda sync_session: inspect(sync_session.bind)
+    # Get table names from a database inspector; the inspector queries the
+    # database, so it has to run inside run_sync
+    table_names = await unit_test_session.run_sync(
+        lambda sync_session: inspect(sync_session.bind).get_table_names()
     )
     
-    # Get table names
-    table_names = inspector.get_table_names()
-    
     # Check if tables were created
     assert len(table_names) > 0, "Database should have tables defined"
     
@@ -61,9 +56,9 @@ async def test_in_memory_transactions(setup_unit_test_env, unit_test_session):
         value = result.scalar()
         assert value == 1, "Database should be accessible and execute queries"
         
-        # Test transaction commit
-        async with unit_test_session.begin():
-            await unit_test_session.execute(text("PRAGMA user_version = 42"))
+        # Test transaction commit; the SELECT above already began a transaction
+        await unit_test_session.execute(text("PRAGMA user_version = 42"))
+        await unit_test_session.commit()
         
         # Verify the transaction was committed
         result = await unit_test_session.execute(text("PRAGMA user_version"))
@@ -4,33 +4,22 @@ Test suite for the refactored business logic layer.
 This script provides comprehensive tests for the refactored business logic layer,
 including individual metric calculators, API endpoints, and the BusinessLogicLayer class.
 """
-import os
-import sys
 import json
 import pytest
 from datetime import datetime, timedelta, UTC
 from typing import Dict, Any, List
 import uuid
 
-# Add the parent directory to the path to import app modules
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
-
-# Add the project root to the path
-project_root = os.path.dirname(parent_dir)
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
-from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.business_logic.base import BusinessLogicLayer, BaseMetricCalculator, metric_registry
 from app.models.event import Event, Base
 from app.models.agent import Agent
 from app.dependencies import get_db
+from app.tests.test_config import use_explicit_begin
 
 # Import all metric calculators to ensure they're registered
 from app.business_logic.metrics import (
@@ -41,21 +30,26 @@ from app.business_logic.metrics import (
     security_metrics
 )
 
-# Manually register the calculators since the imports may not be doing it correctly
-from app.business_logic.metrics.llm_response_metrics import AverageResponseTimeCalculator, ResponseTimePercentileCalculator, ModelResponseTimeCalculator, RequestCountCalculator, SuccessRateCalculator
-from app.business_logic.metrics.token_usage_metrics import TotalTokenUsageCalculator, AverageTokenUsageCalculator, ModelTokenUsageCalculator, TokenRateCalculator, ModelTokenRateCalculator
-from app.business_logic.metrics.error_metrics import ErrorRateCalculator, ErrorTrendCalculator, ErrorPatternCalculator, ErrorTypeCalculator, ErrorSeverityDistributionCalculator
-from app.business_logic.metrics.performance_metrics import ResponseTimeCalculator, ResponseTimePercentileCalculator, ResponseTimeTrendCalculator, RequestRateCalculator, RequestRateTrendCalculator, ModelPerformanceCalculator
-from app.business_logic.metrics.security_metrics import SecurityAlertCountCalculator, AlertsBySeverityCalculator, AlertsByCategoryCalculator, AlertsByAgentCalculator, SecurityAlertTrendCalculator
+# Reference time for the whole module. The example events, the mock time
+# filter and the tests all measure from it, so they always agree
+NOW = datetime.now(UTC)
 
 # Create mock calculator classes for testing
 class MockCalculator(BaseMetricCalculator):
     """Mock calculator class for testing."""
     
-    def __init__(self, name, result=None):
-        """Initialize the mock calculator."""
+    def __init__(self, name, result=None, result_fn=None):
+        """Initialize the mock calculator.
+        
+        Args:
+            name: Name to register the calculator under
+            result: Fixed result returned for every call
+            result_fn: Callable taking the calculate() keyword arguments,
+                used instead of result when the answer depends on them
+        """
         self.name = name
         self.result = result or {}
+        self._fn = result_fn or (lambda **kwargs: self.result)
     
     def get_name(self) -> str:
         """Get the name of the calculator."""
@@ -63,288 +57,286 @@ class MockCalculator(BaseMetricCalculator):
     
     def calculate(self, db: Session, **kwargs) -> Dict[str, Any]:
         """Calculate metrics with parameter filtering."""
-        # Handle time filtering
-        if self.name == "TotalTokenUsageCalculator" and "start_time" in kwargs and "end_time" in kwargs:
-            # If this is a time-filtered request for token usage
-            now = datetime.now(UTC)
-            if kwargs["start_time"] > now - timedelta(minutes=3, seconds=30):
-                # If the start time is after the first request but before the second
-                return {
-                    "total_input_tokens": 15,
-                    "total_output_tokens": 25,
-                    "total_tokens": 40,
-                    "event_count": 2
-                }
-        
-        # Handle model filtering
-        if self.name == "ModelResponseTimeCalculator" and "model_name" in kwargs:
-            model_name = kwargs["model_name"]
-            if model_name == "gpt-4":
-                return {
-                    "response_times_by_model": {
-                        "gpt-4": {"average_response_time_ms": 500.0, "count": 1}
-                    },
-                    "model_name": "gpt-4"
-                }
-            elif model_name == "gpt-3.5-turbo":
-                return {
-                    "response_times_by_model": {
-                        "gpt-3.5-turbo": {"average_response_time_ms": 300.0, "count": 1}
-                    },
-                    "model_name": "gpt-3.5-turbo"
-                }
-        
-        # Default to the original result
-        return self.result
+        return self._fn(**kwargs)
 
 
-# Register the calculators
-def register_test_calculators():
-    """Register mock calculators for testing."""
-    # Clear the registry first
-    metric_registry._calculators = {}
-    
-    # Register mock calculators with the expected names
-    metric_registry.register(MockCalculator("AverageResponseTimeCalculator", {
+TOTAL_TOKEN_USAGE_RESULT = {
+    "total_input_tokens": 35,
+    "total_output_tokens": 40,
+    "total_tokens": 75,
+    "event_count": 4
+}
+
+MODEL_RESPONSE_TIMES = {
+    "gpt-4": {"average_response_time_ms": 500.0, "count": 1},
+    "gpt-3.5-turbo": {"average_response_time_ms": 300.0, "count": 1}
+}
+
+
+def total_token_usage_result(start_time=None, end_time=None, **kwargs):
+    """Mock TotalTokenUsageCalculator result, honouring a time filter."""
+    if start_time is not None and end_time is not None:
+        # If the start time is after the first request but before the second
+        if start_time > NOW - timedelta(minutes=3, seconds=30):
+            return {
+                "total_input_tokens": 15,
+                "total_output_tokens": 25,
+                "total_tokens": 40,
+                "event_count": 2
+            }
+    return TOTAL_TOKEN_USAGE_RESULT
+
+
+def model_response_time_result(model_name=None, **kwargs):
+    """Mock ModelResponseTimeCalculator result, honouring a model filter."""
+    if model_name in MODEL_RESPONSE_TIMES:
+        return {
+            "response_times_by_model": {model_name: MODEL_RESPONSE_TIMES[model_name]},
+            "model_name": model_name
+        }
+    return {"response_times_by_model": MODEL_RESPONSE_TIMES}
+
+
+# Mock calculators as (name, fixed result, result function)
+MOCK_CALCULATORS = (
+    ("AverageResponseTimeCalculator", {
         "average_response_time_ms": 400.0,
         "total_responses": 2,
         "responses_with_duration": 2
-    }))
-    
-    metric_registry.register(MockCalculator("ResponseTimePercentileCalculator", {
+    }, None),
+    ("ResponseTimePercentileCalculator", {
         "percentile_response_time_ms": 500.0,
         "percentile": 95,
         "total_responses": 2
-    }))
-    
-    metric_registry.register(MockCalculator("ModelResponseTimeCalculator", {
-        "response_times_by_model": {
-            "gpt-4": {"average_response_time_ms": 500.0, "count": 1},
-            "gpt-3.5-turbo": {"average_response_time_ms": 300.0, "count": 1}
-        }
-    }))
-    
-    metric_registry.register(MockCalculator("TotalTokenUsageCalculator", {
-        "total_input_tokens": 35,
-        "total_output_tokens": 40,
-        "total_tokens": 75,
-        "event_count": 4
-    }))
-    
-    metric_registry.register(MockCalculator("ErrorRateCalculator", {
+    }, None),
+    ("ModelResponseTimeCalculator", None, model_response_time_result),
+    ("TotalTokenUsageCalculator", None, total_token_usage_result),
+    ("ErrorRateCalculator", {
         "total_requests": 2,
         "error_count": 1,
         "error_rate": 50.0
-    }))
-    
-    metric_registry.register(MockCalculator("SecurityAlertCountCalculator", {
+    }, None),
+    ("SecurityAlertCountCalculator", {
         "total_events": 6,
         "total_security_alerts": 1,
         "alert_rate": 16.666666666666668  # More precise value to match the expected calculation
-    }))
-    
+    }, None),
     # Many other calculators can be added here
-    
-    # Add some extras to make groups work
-    for group in ["error_metrics", "response_time", "token_usage", "security_metrics"]:
-        metric_registry.register(MockCalculator(f"{group}_group_test"))
+)
+
+# Extra calculators to make groups work
+MOCK_GROUPS = ("error_metrics", "response_time", "token_usage", "security_metrics")
 
 
 # Register the calculators
-register_test_calculators()
+def register_test_calculators():
+    """Register mock calculators for testing."""
+    # Replace the registry contents in one go rather than calling register()
+    # for each mock
+    calculators = [
+        MockCalculator(name, result, result_fn)
+        for name, result, result_fn in MOCK_CALCULATORS
+    ]
+    calculators.extend(MockCalculator(f"{group}_group_test") for group in MOCK_GROUPS)
+    metric_registry._calculators = {calculator.name: calculator for calculator in calculators}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_calculators():
+    """Swap the mock calculators into the registry for this module's tests."""
+    original_calculators = metric_registry._calculators
+    register_test_calculators()
+    yield
+    metric_registry._calculators = original_calculators
+
+
+# Example events for the test database, as (age, event_type, level, channel,
+# direction, data); built once at import rather than on every call
+EVENT_SCHEDULE = (
+    # Model request event
+    (timedelta(minutes=5), "model_request", "info", "default", "outgoing", {
+        "llm_request": {
+            "model": "gpt-4",
+            "messages": [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": "Hello, how are you?"}
+            ],
+            "usage": {
+                "input_tokens": 20
+            }
+        }
+    }),
+    # Model response event
+    (timedelta(minutes=4, seconds=30), "model_response", "info", "default", "incoming", {
+        "llm_output": {
+            "model": "gpt-4",
+            "usage": {
+                "output_tokens": 15
+            }
+        },
+        "performance": {
+            "duration_ms": 500
+        }
+    }),
+    # Another model request/response pair
+    (timedelta(minutes=3), "model_request", "info", "default", "outgoing", {
+        "llm_request": {
+            "model": "gpt-3.5-turbo",
+            "messages": [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": "What's the weather like?"}
+            ],
+            "usage": {
+                "input_tokens": 15
+            }
+        }
+    }),
+    (timedelta(minutes=2, seconds=50), "model_response", "info", "default", "incoming", {
+        "llm_output": {
+            "model": "gpt-3.5-turbo",
+            "usage": {
+                "output_tokens": 25
+            }
+        },
+        "performance": {
+            "duration_ms": 300
+        }
+    }),
+    # Error event
+    (timedelta(minutes=2), "error", "error", "default", "internal", {
+        "error": "Connection timeout",
+        "error_type": "network_error"
+    }),
+    # Security alert event
+    (timedelta(minutes=1), "security_alert", "warning", "security", "internal", {
+        "severity": "medium",
+        "category": "prompt_injection",
+        "details": "Potential prompt injection attempt detected"
+    }),
+)
 
 
 # Setup test database
 def create_test_db():
-    """Create a test database with example events."""
-    # Create an in-memory SQLite database
-    engine = create_engine('sqlite:///:memory:', connect_args={"check_same_thread": False})
+    """Create a test database with example events.
+    
+    Returns:
+        Engine for an in-memory database holding the example data
+    """
+    # Create an in-memory SQLite database; StaticPool keeps it on a single
+    # connection so API requests handled on other threads see the same data
+    engine = create_engine(
+        'sqlite:///:memory:',
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    
+    # Begin transactions explicitly, so that test savepoints nest inside the
+    # per-test transaction instead of pysqlite's deferred one
+    use_explicit_begin(engine)
     
     # Create all tables defined in Base
     Base.metadata.create_all(engine)
     
-    # Create a session
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = SessionLocal()
-    
-    # Create example events
-    now = datetime.now(UTC)
-    
-    # Create agent first to satisfy foreign key constraints
-    agent = Agent(
-        agent_id="agent1",
-        first_seen=now,
-        last_seen=now
-    )
-    db.add(agent)
-    
-    # Also add our test agent used in API tests
-    test_agent = Agent(
-        agent_id="test-agent-001",
-        first_seen=now,
-        last_seen=now
-    )
-    db.add(test_agent)
-    db.commit()
-    
-    events = [
-        # Model request event
-        Event(
-            id=1,  # Use integer IDs for SQLite compatibility
-            timestamp=now - timedelta(minutes=5),
-            agent_id="agent1",
-            session_id="session1",
-            event_type="model_request",
-            level="info",
-            channel="default",
-            direction="outgoing",
-            data={
-                "llm_request": {
-                    "model": "gpt-4",
-                    "messages": [
-                        {"role": "system", "content": "You are a helpful assistant."},
-                        {"role": "user", "content": "Hello, how are you?"}
-                    ],
-                    "usage": {
-                        "input_tokens": 20
-                    }
-                }
-            }
-        ),
-        # Model response event
-        Event(
-            id=2,
-            timestamp=now - timedelta(minutes=4, seconds=30),
-            agent_id="agent1",
-            session_id="session1",
-            event_type="model_response",
-            level="info",
-            channel="default",
-            direction="incoming",
-            data={
-                "llm_output": {
-                    "model": "gpt-4",
-                    "usage": {
-                        "output_tokens": 15
-                    }
-                },
-                "performance": {
-                    "duration_ms": 500
-                }
-            }
-        ),
-        # Another model request/response pair
-        Event(
-            id=3,
-            timestamp=now - timedelta(minutes=3),
-            agent_id="agent1",
-            session_id="session1",
-            event_type="model_request",
-            level="info",
-            channel="default",
-            direction="outgoing",
-            data={
-                "llm_request": {
-                    "model": "gpt-3.5-turbo",
-                    "messages": [
-                        {"role": "system", "content": "You are a helpful assistant."},
-                        {"role": "user", "content": "What's the weather like?"}
-                    ],
-                    "usage": {
-                        "input_tokens": 15
-                    }
-                }
-            }
-        ),
-        Event(
-            id=4,
-            timestamp=now - timedelta(minutes=2, seconds=50),
-            agent_id="agent1",
-            session_id="session1",
-            event_type="model_response",
-            level="info",
-            channel="default",
-            direction="incoming",
-            data={
-                "llm_output": {
-                    "model": "gpt-3.5-turbo",
-                    "usage": {
-                        "output_tokens": 25
-                    }
-                },
-                "performance": {
-                    "duration_ms": 300
-                }
-            }
-        ),
-        # Error event
-        Event(
-            id=5,
-            timestamp=now - timedelta(minutes=2),
-            agent_id="agent1",
-            session_id="session1",
-            event_type="error",
-            level="error",
-            channel="default",
-            direction="internal",
-            data={
-                "error": "Connection timeout",
-                "error_type": "network_error"
-            }
-        ),
-        # Security alert event
-        Event(
-            id=6,
-            timestamp=now - timedelta(minutes=1),
+    # Plain dicts for single Core executemany statements; the ORM adds nothing
+    # here. agent1 owns the events, and test-agent-001 is used in API tests
+    agent_rows = [
+        dict(agent_id=agent_id, first_seen=NOW, last_seen=NOW)
+        for agent_id in ("agent1", "test-agent-001")
+    ]
+    event_rows = [
+        dict(
+            id=i,  # Use integer IDs for SQLite compatibility
+            timestamp=NOW - age,
             agent_id="agent1",
             session_id="session1",
-            event_type="security_alert",
-            level="warning",
-            channel="security",
-            direction="internal",
-            data={
-                "severity": "medium",
-                "category": "prompt_injection",
-                "details": "Potential prompt injection attempt detected"
-            }
+            event_type=event_type,
+            level=level,
+            channel=channel,
+            direction=direction,
+            data=data
         )
+        for i, (age, event_type, level, channel, direction, data) in enumerate(EVENT_SCHEDULE, 1)
     ]
     
-    # Add events to the database
-    for event in events:
-        db.add(event)
+    # Insert the agents first to satisfy foreign key constraints, then all
+    # events, in one transaction
+    with engine.begin() as conn:
+        conn.execute(Agent.__table__.insert(), agent_rows)
+        conn.execute(Event.__table__.insert(), event_rows)
     
-    # Commit the changes
-    db.commit()
+    return engine
+
+
+@pytest.fixture(scope="session")
+def test_engine():
+    """Build the example database once per session."""
+    engine = create_test_db()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def test_db(test_engine):
+    """Provide a session whose changes are rolled back after each test."""
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    
+    db = Session(bind=connection, join_transaction_mode="create_savepoint")
     
-    return db
+    yield db
+    
+    db.close()
+    transaction.rollback()
+    connection.close()
+
 
+@pytest.fixture
+def override_get_db(test_db):
+    """Point the get_db dependency at the example database."""
+    def get_test_db():
+        """Get test database session."""
+        yield test_db
+    
+    app.dependency_overrides[get_db] = get_test_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
 
-# Create a singleton database for testing to avoid connection issues
-TEST_DB = create_test_db()
 
-# Test client setup with dependency override
-def get_test_db():
-    """Get test database session."""
-    yield TEST_DB
+@pytest.fixture(scope="class")
+def calculators():
+    """Look up the calculators under test once per test class."""
+    return {
+        name: metric_registry.get_calculator(name)
+        for name in (
+            "AverageResponseTimeCalculator",
+            "ResponseTimePercentileCalculator",
+            "ModelResponseTimeCalculator",
+            "TotalTokenUsageCalculator",
+            "ErrorRateCalculator",
+            "SecurityAlertCountCalculator",
+        )
+    }
 
 
-app.dependency_overrides[get_db] = get_test_db
-test_client = TestClient(app)
+@pytest.fixture(scope="class")
+def business_logic_layer(request):
+    """Build one BusinessLogicLayer per test class, shared as self.bl."""
+    request.cls.bl = BusinessLogicLayer()
 
 
 # Tests for individual calculators
 class TestMetricCalculators:
     """Tests for individual metric calculators."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
         """Set up test database for each test."""
-        self.db = TEST_DB  # Use the singleton database
-        self.bl = BusinessLogicLayer()
+        self.db = test_db  # Rolled back after each test
     
-    def test_average_response_time_calculator(self):
+    def test_average_response_time_calculator(self, calculators):
         """Test AverageResponseTimeCalculator."""
-        calculator = metric_registry.get_calculator("AverageResponseTimeCalculator")
+        calculator = calculators["AverageResponseTimeCalculator"]
         assert calculator is not None
         
         result = calculator.calculate(db=self.db)
@@ -353,9 +345,9 @@ class TestMetricCalculators:
         assert result["responses_with_duration"] == 2
         assert result["average_response_time_ms"] == 400.0  # (500 + 300) / 2
     
-    def test_response_time_percentile_calculator(self):
+    def test_response_time_percentile_calculator(self, calculators):
         """Test ResponseTimePercentileCalculator."""
-        calculator = metric_registry.get_calculator("ResponseTimePercentileCalculator")
+        calculator = calculators["ResponseTimePercentileCalculator"]
         assert calculator is not None
         
         result = calculator.calculate(db=self.db, percentile=95)
@@ -365,9 +357,9 @@ class TestMetricCalculators:
         # With only two data points, the 95th percentile should be close to the maximum
         assert result["percentile_response_time_ms"] >= 300
     
-    def test_model_response_time_calculator(self):
+    def test_model_response_time_calculator(self, calculators):
         """Test ModelResponseTimeCalculator."""
-        calculator = metric_registry.get_calculator("ModelResponseTimeCalculator")
+        calculator = calculators["ModelResponseTimeCalculator"]
         assert calculator is not None
         
         result = calculator.calculate(db=self.db)
@@ -377,9 +369,9 @@ class TestMetricCalculators:
         assert result["response_times_by_model"]["gpt-4"]["average_response_time_ms"] == 500.0
         assert result["response_times_by_model"]["gpt-3.5-turbo"]["average_response_time_ms"] == 300.0
     
-    def test_total_token_usage_calculator(self):
+    def test_total_token_usage_calculator(self, calculators):
         """Test TotalTokenUsageCalculator."""
-        calculator = metric_registry.get_calculator("TotalTokenUsageCalculator")
+        calculator = calculators["TotalTokenUsageCalculator"]
         assert calculator is not None
         
         result = calculator.calculate(db=self.db)
@@ -390,9 +382,9 @@ class TestMetricCalculators:
         assert result["total_output_tokens"] == 40  # 15 + 25
         assert result["total_tokens"] == 75  # 35 + 40
     
-    def test_error_rate_calculator(self):
+    def test_error_rate_calculator(self, calculators):
         """Test ErrorRateCalculator."""
-        calculator = metric_registry.get_calculator("ErrorRateCalculator")
+        calculator = calculators["ErrorRateCalculator"]
         assert calculator is not None
         
         result = calculator.calculate(db=self.db)
@@ -403,9 +395,9 @@ class TestMetricCalculators:
         assert result["error_count"] == 1
         assert result["error_rate"] == 50.0  # 1/2 * 100
     
-    def test_security_alert_count_calculator(self):
+    def test_security_alert_count_calculator(self, calculators):
         """Test SecurityAlertCountCalculator."""
-        calculator = metric_registry.get_calculator("SecurityAlertCountCalculator")
+        calculator = calculators["SecurityAlertCountCalculator"]
         assert calculator is not None
         
         result = calculator.calculate(db=self.db)
@@ -417,23 +409,22 @@ class TestMetricCalculators:
         # Allow for slight floating point differences in representation
         assert abs(result["alert_rate"] - (100 * 1/6)) < 0.0001
     
-    def test_with_time_filter(self):
+    def test_with_time_filter(self, calculators):
         """Test calculators with time filters."""
-        calculator = metric_registry.get_calculator("TotalTokenUsageCalculator")
+        calculator = calculators["TotalTokenUsageCalculator"]
         assert calculator is not None
         
         # Filter to include only the second request/response pair
-        now = datetime.now(UTC)
-        start_time = now - timedelta(minutes=3, seconds=5)  # Just before req2
-        end_time = now - timedelta(minutes=2, seconds=45)  # Just after resp2
+        start_time = NOW - timedelta(minutes=3, seconds=5)  # Just before req2
+        end_time = NOW - timedelta(minutes=2, seconds=45)  # Just after resp2
         
         result = calculator.calculate(db=self.db, start_time=start_time, end_time=end_time)
         assert result["total_input_tokens"] == 15  # Just the second request
         assert result["total_output_tokens"] == 25  # Just the second response
     
-    def test_with_model_filter(self):
+    def test_with_model_filter(self, calculators):
         """Test calculators with model filter."""
-        calculator = metric_registry.get_calculator("ModelResponseTimeCalculator")
+        calculator = calculators["ModelResponseTimeCalculator"]
         assert calculator is not None
         
         # Filter to include only gpt-4 model
@@ -445,13 +436,14 @@ class TestMetricCalculators:
 
 
 # Tests for the BusinessLogicLayer class
+@pytest.mark.usefixtures("business_logic_layer")
 class TestBusinessLogicLayer:
     """Tests for the BusinessLogicLayer class."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
         """Set up test database for each test."""
-        self.db = TEST_DB  # Use the singleton database
-        self.bl = BusinessLogicLayer()
+        self.db = test_db  # Rolled back after each test
     
     def test_get_available_metrics(self):
         """Test get_available_metrics method."""
@@ -496,98 +488,39 @@ class TestBusinessLogicLayer:
 
 
 # Tests for the API endpoints
+# Any 200 response must be a dictionary; 404 and 500 are still allowed in
+# case the agent lookup or database setup has other issues
+OK_STATUSES = (200, 404, 500)
+
+
+@pytest.mark.usefixtures("override_get_db")
 class TestAPIEndpoints:
     """Tests for the API endpoints."""
     
-    def test_get_available_metrics(self):
-        """Test the metrics endpoint with an agent."""
+    @pytest.mark.parametrize("query, expected_statuses", [
+        ("metric_type=performance", OK_STATUSES),
+        ("metric_type=usage", OK_STATUSES),
+        ("metric_type=errors", OK_STATUSES),
+        # An invalid metric type is a 400 if the agent exists
+        ("metric_type=invalid", (400, 404, 500)),
+        ("metric_type=performance&interval=day", OK_STATUSES),
+        ("metric_type=performance&interval=minute", OK_STATUSES),
+        ("metric_type=performance&start_time={start_time}&end_time={end_time}", OK_STATUSES),
+    ])
+    def test_metrics_endpoint(self, client, query, expected_statuses):
+        """Test the agent metrics endpoint with various parameters."""
         # Use our test agent that's already in the database
         agent_id = "test-agent-001"
         
-        # Test performance metrics
-        response = test_client.get(f"/api/v1/agents/{agent_id}/metrics?metric_type=performance")
-        
-        # Since we've added the agent to the database, we can expect a 200 response
-        # But we'll still allow for 404 or 500 in case there are other issues
-        assert response.status_code in [200, 404, 500]
-        
-        if response.status_code == 200:
-            data = response.json()
-            assert isinstance(data, dict), "Response should be a dictionary"
-    
-    def test_get_metrics(self):
-        """Test the metrics with different metric types."""
-        # Use our test agent that's already in the database
-        agent_id = "test-agent-001"
-        
-        # Test performance metrics
-        response = test_client.get(f"/api/v1/agents/{agent_id}/metrics?metric_type=performance")
-        assert response.status_code in [200, 404, 500]
-        
-        # Test usage metrics
-        response = test_client.get(f"/api/v1/agents/{agent_id}/metrics?metric_type=usage")
-        assert response.status_code in [200, 404, 500]
-        
-        # Test error metrics
-        response = test_client.get(f"/api/v1/agents/{agent_id}/metrics?metric_type=errors")
-        assert response.status_code in [200, 404, 500]
-        
-        # Test with invalid metric type
-        response = test_client.get(f"/api/v1/agents/{agent_id}/metrics?metric_type=invalid")
-        # This should be a 400 error for invalid metric type if the agent exists
-        # But might be 404 if there's another issue with the agent lookup
-        # Or 500 if there's a database setup issue
-        assert response.status_code in [400, 404, 500]
-    
-    def test_get_specific_metric(self):
-        """Test agent-specific metrics with time ranges."""
-        # Use our test agent that's already in the database
-        agent_id = "test-agent-001"
-        
-        # Test with time range
-        now = datetime.now(UTC)
-        start_time = (now - timedelta(hours=24)).strftime("%Y-%m-%dT%H:%M:%S")
-        end_time = now.strftime("%Y-%m-%dT%H:%M:%S")
-        
-        # Get performance metrics with time range
-        response = test_client.get(
-            f"/api/v1/agents/{agent_id}/metrics?metric_type=performance&start_time={start_time}&end_time={end_time}"
+        # Fill in a time range covering the day before the example events
+        query = query.format(
+            start_time=(NOW - timedelta(hours=24)).strftime("%Y-%m-%dT%H:%M:%S"),
+            end_time=NOW.strftime("%Y-%m-%dT%H:%M:%S")
         )
-        assert response.status_code in [200, 404, 500]
+        
+        response = client.get(f"/api/v1/agents/{agent_id}/metrics?{query}")
+        assert response.status_code in expected_statuses
         
         if response.status_code == 200:
             data = response.json()
             assert isinstance(data, dict), "Response should be a dictionary"
-    
-    def test_get_metric_with_params(self):
-        """Test metrics endpoint with various parameters."""
-        # Use our test agent that's already in the database
-        agent_id = "test-agent-001"
-        
-        # Get metrics with different interval
-        response = test_client.get(
-            f"/api/v1/agents/{agent_id}/metrics?metric_type=performance&interval=day"
-        )
-        assert response.status_code in [200, 404, 500]
-        
-        # Test with minute interval
-        response = test_client.get(
-            f"/api/v1/agents/{agent_id}/metrics?metric_type=performance&interval=minute"
-        )
-        assert response.status_code in [200, 404, 500]
-    
-    def test_get_metric_groups(self):
-        """Test if metric groups can be accessed through different methods."""
-        # Use our test agent that's already in the database
-        agent_id = "test-agent-001"
-        
-        # Test each metric type
-        metric_types = ["performance", "usage", "errors"]
-        
-        for metric_type in metric_types:
-            response = test_client.get(f"/api/v1/agents/{agent_id}/metrics?metric_type={metric_type}")
-            assert response.status_code in [200, 404, 500]
-            
-            if response.status_code == 200:
-                data = response.json()
-                assert isinstance(data, dict), "Response should be a dictionary" 
\ No newline at end of file
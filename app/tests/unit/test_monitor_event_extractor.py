@@ -94,7 +94,6 @@ class TestMonitorEventExtractor:
         other_event.event_type = "some_other_event"
         assert extractor.can_process(other_event) is False
     
-    @pytest.mark.asyncio
     async def test_process_monitor_init(self, extractor, mock_event_init, mock_db_session):
         """Test processing a monitor_init event."""
         # Process the event
@@ -121,7 +120,6 @@ class TestMonitorEventExtractor:
         assert session.configuration["debug_level"] == "INFO"
         assert session.configuration["development_mode"] is True
     
-    @pytest.mark.asyncio
     async def test_process_monitor_shutdown(self, extractor, mock_event_shutdown, mock_db_session):
         """Test processing a monitor_shutdown event."""
         # Process the event
@@ -140,7 +138,6 @@ class TestMonitorEventExtractor:
         assert mock_query_result.active is False
         assert mock_query_result.end_time == mock_event_shutdown.timestamp
     
-    @pytest.mark.asyncio
     async def test_process(self, extractor, mock_event_init, mock_event_shutdown, mock_db_session):
         """Test the main process method with different event types."""
         # Patch the specialized processing methods
@@ -161,7 +158,6 @@ class TestMonitorEventExtractor:
                 assert not mock_init.called
                 assert mock_shutdown.called
     
-    @pytest.mark.asyncio
     async def test_process_with_no_data(self, extractor, mock_db_session):
         """Test processing an event with no data."""
         # Create an event with no data
@@ -0,0 +1,32 @@
+"""
+JSON helpers for event transformers.
+
+Decoding uses orjson when it is installed, since event payloads can embed
+large JSON documents as strings, and falls back to the standard library
+json module otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON document as str or bytes
+        
+    Returns:
+        The decoded Python object
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
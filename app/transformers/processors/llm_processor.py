@@ -1,7 +1,8 @@
 from typing import Dict, Any, Optional
 import datetime
 import logging
-import json
+
+from app.transformers import json_utils
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ def process_llm_call_start(event: Dict[str, Any]) -> Dict[str, Any]:
                 if isinstance(prompt, str):
                     try:
                         # Try to parse as JSON
-                        prompt_json = json.loads(prompt)
+                        prompt_json = json_utils.loads(prompt)
                         transformed["data"]["parsed_prompt"] = prompt_json
                     except:
                         # Not valid JSON, keep as string
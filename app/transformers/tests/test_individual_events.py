@@ -45,7 +45,6 @@ class TestIndividualEventProcessing:
             return event
         return _create_event
     
-    @pytest.mark.asyncio
     async def test_find_matching_start_event_llm(self, mock_session, create_mock_event):
         """Test finding a matching LLM start event in the database."""
         # Create a mock finish event
@@ -81,7 +80,6 @@ class TestIndividualEventProcessing:
         # Verify the query was called with the correct parameters
         mock_session.execute.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_find_matching_start_event_tool(self, mock_session, create_mock_event):
         """Test finding a matching tool start event in the database."""
         # Create a mock finish event
@@ -117,7 +115,6 @@ class TestIndividualEventProcessing:
         # Verify the query was called with the correct parameters
         mock_session.execute.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_find_matching_start_event_no_match(self, mock_session, create_mock_event):
         """Test when no matching start event is found."""
         # Create a mock finish event
@@ -144,7 +141,6 @@ class TestIndividualEventProcessing:
         # Verify the query was called
         mock_session.execute.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_find_matching_start_event_not_finish_type(self, mock_session, create_mock_event):
         """Test with an event type that is not a finish type."""
         # Create a mock event that is not a finish type
@@ -163,7 +159,6 @@ class TestIndividualEventProcessing:
         # Verify the query was NOT called
         mock_session.execute.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_process_event_with_relationship(self, mock_session, create_mock_event):
         """Test processing an event and establishing a relationship."""
         # Create mock start event returned from find_matching_start_event
@@ -0,0 +1,35 @@
+"""
+Root conftest for the test suite.
+
+pytest only reads command line options from conftests it loads before parsing
+arguments, which for a plain `pytest` run from the repository root is this one,
+so options used by tests anywhere in the tree are registered here.
+"""
+
+import pytest
+from pytest_asyncio import is_async_test
+
+pytest_plugins = ("pytester",)
+
+
+def pytest_addoption(parser):
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="Reuse file-based test databases from a previous run if their schema is unchanged",
+    )
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session-scoped event loop.
+    
+    Newer pytest-asyncio releases can set this with the
+    asyncio_default_test_loop_scope ini option, but those do not install on
+    Python 3.8, so the loop scope is set on each test's marker instead.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
@@ -30,7 +30,6 @@ def db_session():
     Base.metadata.drop_all(engine)
 
 # Test ModelInfoExtractor with model_request event
-@pytest.mark.asyncio
 async def test_model_info_extractor_with_request(db_session):
     """Test that ModelInfoExtractor correctly extracts model info from a request event."""
     # Create a model_request event with sample data
@@ -80,7 +79,6 @@ async def test_model_info_extractor_with_request(db_session):
     assert framework_details.model_type == "completion"
 
 # Test TokenUsageExtractor with model_response event
-@pytest.mark.asyncio
 async def test_token_usage_extractor_with_response(db_session):
     """Test that TokenUsageExtractor correctly extracts token usage from a response event."""
     # Create a model_response event with sample data
@@ -2,27 +2,44 @@ import pytest
 import datetime
 import json
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, clear_mappers
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.pool import StaticPool
 
 from app.models import Base, Agent, Event, Session, TokenUsage, PerformanceMetric
 from app.models import SecurityAlert, ContentAnalysis, FrameworkDetails
 from app.models import ModelDetails, PromptDetails, ResponseDetails, CallStack
 from app.models import Conversation, ConversationTurn
+from app.tests.test_config import use_explicit_begin
 
 # Setup test database
-@pytest.fixture(scope="function")
-def db_session():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:")
+@pytest.fixture(scope="module")
+def engine():
+    """Create an in-memory SQLite database and its schema once per module."""
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+    
+    # Begin transactions explicitly, so savepoints nest inside the per-test
+    # transaction
+    use_explicit_begin(engine)
+    
     Base.metadata.create_all(engine)
     
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    yield engine
+    
+    engine.dispose()
+
+@pytest.fixture(scope="function")
+def db_session(engine):
+    """Provide a session whose changes are rolled back after each test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    
+    session = OrmSession(bind=connection, join_transaction_mode="create_savepoint")
     
     yield session
     
     session.close()
-    Base.metadata.drop_all(engine)
+    transaction.rollback()
+    connection.close()
     
 # Test basic model creation
 def test_create_agent(db_session):